@@ -1,10 +1,18 @@
 from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
 from agents.base_agent import BaseAgent
 from tools.helius_client import HeliusClient
 from datetime import datetime, timedelta
 from models.position import Position, PositionStatus, ExitReason
 import json
 
+@dataclass(slots=True)
+class MonitorEntry:
+    """A position being watched, with its last check time and raised alerts"""
+    position: Position
+    last_check: datetime
+    alerts: List[Dict[str, Any]] = field(default_factory=list)
+
 class EnhancedMonitorAgent(BaseAgent):
     """Enhanced monitor agent that works with the position manager"""
     
@@ -16,7 +24,7 @@ class EnhancedMonitorAgent(BaseAgent):
             tools=tools
         )
         self.helius_client = HeliusClient()
-        self.monitored_positions = {}
+        self.monitored_positions: Dict[str, MonitorEntry] = {}
         self.check_interval = 60  # Check every 60 seconds
         self.last_check = datetime.now()
     
@@ -157,10 +165,11 @@ Communication style:
         
         # Get position summary
         summary = position_manager.get_position_summary()
+        now = datetime.now()
         
         return {
             "agent": "EnhancedMonitorAgent",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "positions_monitored": len(active_positions),
             "critical_alerts": len(critical_alerts),
             "alerts": critical_alerts,
@@ -171,7 +180,7 @@ Communication style:
                 "total_pnl_percent": summary.total_pnl_percent,
                 "average_apy": summary.average_apy
             },
-            "next_check": (datetime.now() + timedelta(seconds=self.check_interval)).isoformat()
+            "next_check": (now + timedelta(seconds=self.check_interval)).isoformat()
         }
     
     def get_position_report(self, position_id: str) -> Dict[str, Any]:
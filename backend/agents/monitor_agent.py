@@ -1,9 +1,9 @@
 from typing import Dict, List, Any, Optional
 from agents.base_agent import BaseAgent
 from tools.helius_client import HeliusClient
+from utils.http_client import http_client
 from datetime import datetime, timedelta
 import json
-import requests
 
 class MonitorAgent(BaseAgent):
     """Specialized agent for monitoring existing positions and market changes"""
@@ -249,7 +249,7 @@ Communication style:
                 return {}
             
             # Fetch from Raydium API
-            response = requests.get("https://api.raydium.io/v2/main/pairs", timeout=5)
+            response = http_client.get("https://api.raydium.io/v2/main/pairs", timeout=5)
             if response.status_code == 200:
                 pools = response.json()
                 
@@ -61,8 +61,7 @@ Communication style:
             raydium_scanner = RadiumScannerTool()
             
             # Execute Raydium scan
-            raydium_result = raydium_scanner._run(min_apy=min_apy, min_tvl=10000)
-            raydium_data = json.loads(raydium_result)
+            raydium_data = raydium_scanner.scan_pools(min_apy=min_apy, min_tvl=10000)
             raydium_pools = raydium_data.get("pools", [])
             
             # Also try DeFiLlama for additional data
@@ -101,8 +101,7 @@ Thought: {agent_scratchpad}
             scorer = DegenScorerTool()
             
             for pool in pool_data.get("pools", []):
-                score_result = scorer._run(pool["pool_address"], pool)
-                score_data = json.loads(score_result)
+                score_data = scorer.score_pool(pool["pool_address"], pool)
                 
                 # Combine pool data with score
                 pool_with_score = {
@@ -141,9 +140,7 @@ Thought: {agent_scratchpad}
             }
             
             scorer = DegenScorerTool()
-            score_result = scorer._run(pool_address, mock_pool_data)
-            
-            return json.loads(score_result)
+            return scorer.score_pool(pool_address, mock_pool_data)
             
         except Exception as e:
             return {"error": str(e)}
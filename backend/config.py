@@ -39,8 +39,17 @@ class Config:
     OPENROUTER_RATE_LIMIT = 20  # Conservative to save credits
     HELIUS_RATE_LIMIT = 300  # Helius has generous limits
     COINGECKO_RATE_LIMIT = 10  # Free tier limit
+    RPC_MAX_CONCURRENT_REQUESTS = 4  # In-flight RPC-heavy requests per endpoint
     
     # API cost optimization
     MAX_POOLS_PER_SCAN = 10  # Limit pools analyzed per scan to save API credits
     ENABLE_CACHING = True  # Cache results for 5 minutes
-    CACHE_TTL = 300  # 5 minutes
\ No newline at end of file
+    CACHE_TTL = 300  # 5 minutes
+    RATE_LIMITER_CACHE_SIZE = 256  # Max cached responses before LRU eviction
+    
+    # Shared state across workers (progress tracking); in-memory fallback when unset
+    REDIS_URL = os.getenv("REDIS_URL")
+    
+    # Worker threads for blocking agent/HTTP calls made from async endpoints
+    AGENT_THREAD_POOL_SIZE = 8
+    PRELOAD_AGENTS = os.getenv("PRELOAD_AGENTS", "").lower() == "true"  # Build agents at startup instead of first use
\ No newline at end of file
@@ -1,8 +1,7 @@
 import os
 from typing import Optional
 import asyncpg
-from asyncpg import Pool, Connection
-import asyncio
+from asyncpg import Pool
 from contextlib import asynccontextmanager
 
 class DatabaseConnection:
@@ -24,24 +24,33 @@ for key in os.environ:
     if any(pattern in key.upper() for pattern in ['PGDATABASE', 'PGHOST', 'PGPORT', 'PGUSER', 'DATABASE', 'DB_']):
         print(f"[STARTUP] Found DB-related var: {key} = {os.environ[key][:30] if os.environ[key] else 'empty'}")
 
-from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
-import json
+import orjson
 import hashlib
+import re
+import traceback
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import time
+from collections import ChainMap
 import asyncio
 
 from agents.coordinator_agent import CoordinatorAgent
 from agents.scanner_agent import ScannerAgent
 from agents.analyzer_agent import AnalyzerAgent
 from agents.monitor_agent import MonitorAgent
-from agents.enhanced_monitor_agent import EnhancedMonitorAgent
+from agents.enhanced_monitor_agent import EnhancedMonitorAgent, MonitorEntry
+from tools.degen_scorer import DegenScorerTool
+from tools.raydium_scanner import RadiumScannerTool
 from config import Config
-from middleware.rate_limiter import rate_limiter, check_api_limit
+from middleware.rate_limiter import rate_limiter, check_api_limit, concurrency_guard
 from services.position_manager import position_manager
-from models.position import Position, PositionStatus
+from models.position import Position, PositionStatus, ExitReason
 from services.wallet_service import get_wallet, TransactionType
 from utils.performance import perf_monitor
 from websocket_manager import ws_manager
@@ -50,43 +59,99 @@ from services.trading_bot import trading_bot
 from services.backtesting import Backtester
 from services.paper_trading import paper_trading
 from models.trading_strategy import StrategyType, STRATEGY_PRESETS
-from utils.cache import api_cache
+from utils.cache import api_cache, cache_raydium_pools, RAYDIUM_POOLS_BY_ID_KEY
+from utils.async_http_client import get_async_http_client, close_async_http_client
+from utils.http_cache import cached_json_response, versioned_json_response
+from utils.progress_store import progress_store
+from utils.request_coalescer import request_coalescer
+from utils.redis_client import close_redis
 from services.strategy_manager import strategy_manager
+from services.task_queue import task_queue
 
 # Import database setup
 from database.setup import run_migrations, verify_connection
-from database.connection import db
+from database.connection import db, get_db_connection
 
-app = FastAPI(title="Solana Degen Hunter Multi-Agent API", version="2.0.0")
+app = FastAPI(
+    title="Solana Degen Hunter Multi-Agent API",
+    version="2.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware
 allowed_origins = [
     "http://localhost:3000",
     "http://localhost:3001",
-    "https://accomplished-sparkle-production.up.railway.app",
-    "https://solana-degen-hunter-frontend-production.up.railway.app",
-    "https://*.up.railway.app",  # Allow all Railway apps
 ]
 
-# In production, be more permissive if needed
-if os.getenv('RAILWAY_ENVIRONMENT'):
-    allowed_origins = ["*"]  # Allow all origins in Railway
+# Railway deployments (incl. the production frontends) - matched by one precompiled regex
+allowed_origin_regex = r"https://[a-z0-9-]+\.up\.railway\.app"
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
+    allow_origin_regex=allowed_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
     expose_headers=["*"],
 )
 
-# Initialize the multi-agent system
-coordinator = CoordinatorAgent()
-scanner = ScannerAgent()
-analyzer = AnalyzerAgent()
-monitor = MonitorAgent()
-enhanced_monitor = EnhancedMonitorAgent()
+# Multi-agent system - each agent is built on first use
+@functools.lru_cache(maxsize=1)
+def get_coordinator() -> CoordinatorAgent:
+    return CoordinatorAgent()
+
+@functools.lru_cache(maxsize=1)
+def get_scanner() -> ScannerAgent:
+    return ScannerAgent()
+
+@functools.lru_cache(maxsize=1)
+def get_analyzer() -> AnalyzerAgent:
+    return AnalyzerAgent()
+
+@functools.lru_cache(maxsize=1)
+def get_monitor() -> MonitorAgent:
+    return MonitorAgent()
+
+@functools.lru_cache(maxsize=1)
+def get_enhanced_monitor() -> EnhancedMonitorAgent:
+    return EnhancedMonitorAgent()
+
+# Stateless tools shared across requests
+degen_scorer = DegenScorerTool()
+raydium_scanner = RadiumScannerTool()
+
+AGENT_FACTORIES = {
+    "coordinator": get_coordinator,
+    "scanner": get_scanner,
+    "analyzer": get_analyzer,
+    "monitor": get_monitor
+}
+
+# Agents and HTTP helpers are synchronous - run them off the event loop
+agent_executor = ThreadPoolExecutor(max_workers=Config.AGENT_THREAD_POOL_SIZE, thread_name_prefix="agent")
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call on the agent thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(agent_executor, functools.partial(func, *args, **kwargs))
+
+async def load_agent(factory):
+    """Get a lazy agent, building it on the thread pool on first use (construction is slow)"""
+    if factory.cache_info().currsize:
+        return factory()
+    return await run_blocking(factory)
+
+async def refresh_positions() -> Dict[str, Dict[str, Any]]:
+    """Fetch pool metrics on the thread pool, then apply them on the event loop.
+    
+    Position and wallet state is only mutated from the loop, so it needs no lock.
+    """
+    addresses = [p.pool_address for p in position_manager.get_active_positions()]
+    pool_metrics = await run_blocking(position_manager.fetch_pool_metrics_batch, addresses)
+    position_manager.apply_pool_metrics(pool_metrics)
+    return pool_metrics
 
 # Request models
 class HuntRequest(BaseModel):
@@ -127,31 +192,37 @@ async def test_endpoint():
         "database_url_preview": os.environ.get('DATABASE_URL', 'not set')[:30] + '...' if os.environ.get('DATABASE_URL') else 'not set'
     }
 
+# Last successful Raydium probe, reused by /health until it expires
+HEALTH_PROBE_TTL = 10
+_raydium_probe_expires = 0.0
+
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint for monitoring"""
+    global _raydium_probe_expires
     try:
-        # Check if we can reach Raydium
-        raydium_ok = False
-        try:
-            import requests
-            resp = requests.get("https://api.raydium.io/v2/main/pairs", timeout=2)
-            raydium_ok = resp.status_code == 200
-        except:
-            pass
-        
-        # Check agent status
-        agents_ok = all([scanner, analyzer, monitor, coordinator])
+        # Check if we can reach Raydium (failures aren't cached, so recovery shows up on the next probe)
+        raydium_ok = time.monotonic() < _raydium_probe_expires
+        if not raydium_ok:
+            try:
+                # Only the status line matters, so don't download the pairs list body
+                async with get_async_http_client().stream("GET", "https://api.raydium.io/v2/main/pairs", timeout=2) as resp:
+                    raydium_ok = resp.status_code == 200
+            except:
+                pass
+            if raydium_ok:
+                _raydium_probe_expires = time.monotonic() + HEALTH_PROBE_TTL
+        
+        # Check agent status without forcing lazy agents to load
+        agents = {
+            name: "initialized" if factory.cache_info().currsize else "not_loaded"
+            for name, factory in AGENT_FACTORIES.items()
+        }
         
-        return {
-            "status": "healthy" if raydium_ok and agents_ok else "degraded",
+        return cached_json_response(request, {
+            "status": "healthy" if raydium_ok else "degraded",
             "system": "multi-agent",
-            "agents": {
-                "coordinator": "initialized" if coordinator else "error",
-                "scanner": "initialized" if scanner else "error", 
-                "analyzer": "initialized" if analyzer else "error",
-                "monitor": "initialized" if monitor else "error"
-            },
+            "agents": agents,
             "config": {
                 "has_helius_key": bool(Config.HELIUS_API_KEY),
                 "has_openrouter_key": bool(Config.OPENROUTER_API_KEY),
@@ -159,22 +230,126 @@ async def health_check():
             },
             "services": {
                 "raydium_api": "up" if raydium_ok else "down",
-                "agents": "up" if agents_ok else "down",
+                "agents": "up",
                 "database": "up",  # Always up since we use in-memory
                 "cache": "up"
             },
             "timestamp": datetime.now().isoformat()
-        }
+        }, max_age=5)
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
-# Global progress tracker
-progress_tracker = {}
-
 @app.get("/progress/{task_id}")
 async def get_progress(task_id: str):
     """Get progress of a running task"""
-    return progress_tracker.get(task_id, {"status": "not_found"})
+    return await progress_store.get(task_id) or {"status": "not_found"}
+
+def _validate_hunt_query(query: str) -> str:
+    """Validate and sanitize a hunt query"""
+    if not query or len(query.strip()) == 0:
+        raise HTTPException(status_code=400, detail="Query cannot be empty")
+    
+    if len(query) > 500:
+        raise HTTPException(status_code=400, detail="Query too long (max 500 characters)")
+    
+    return query.strip()
+
+# Queued/running hunt progress not updated for this long is assumed abandoned (e.g. worker restart)
+HUNT_PROGRESS_STALE_SECONDS = 600
+
+def _hunt_task_id(sanitized_query: str) -> str:
+    """Stable, URL-safe task ID for a hunt query"""
+    return f"hunt_{hashlib.blake2b(sanitized_query.encode(), digest_size=16).hexdigest()}"
+
+async def _execute_hunt(sanitized_query: str, task_id: str) -> Dict[str, Any]:
+    """Run the multi-agent hunt, reporting progress (through to complete/failed) and caching the result"""
+    try:
+        result = await _run_hunt(sanitized_query, task_id)
+    except Exception as e:
+        await progress_store.set(task_id, {
+            "status": "failed",
+            "phase": "error",
+            "progress": 100,
+            "message": str(e)
+        })
+        raise
+    
+    await progress_store.set(task_id, {
+        "status": "complete",
+        "phase": "done",
+        "progress": 100,
+        "message": "Hunt complete",
+        "result": result
+    })
+    await ws_manager.broadcast_progress(
+        task_id=task_id,
+        status="complete",
+        progress=100,
+        message="Hunt complete"
+    )
+    return result
+
+async def _run_hunt(sanitized_query: str, task_id: str) -> Dict[str, Any]:
+    """Run the multi-agent hunt, reporting in-progress phases and caching the result"""
+    # Add debug logging
+    print(f"[API] Starting hunt with sanitized query: {sanitized_query}")
+    start_time = datetime.now()
+    
+    print(f"[API] Calling coordinator.hunt_opportunities...")
+    await progress_store.set(task_id, {
+        "status": "scanning",
+        "phase": "discovery",
+        "progress": 10,
+        "message": "Scanner Agent discovering pools..."
+    })
+    
+    # Broadcast progress via WebSocket
+    await ws_manager.broadcast_progress(
+        task_id=task_id,
+        status="scanning",
+        progress=10,
+        message="Scanner Agent discovering pools..."
+    )
+    
+    # Execute hunt with progress updates
+    print("[API] Phase 1: Scanner Agent starting...")
+    try:
+        coordinator = await load_agent(get_coordinator)
+        result = await run_blocking(coordinator.hunt_opportunities, sanitized_query)
+        print(f"[API] Coordinator returned: {result.get('success', False)}")
+    except Exception as coord_error:
+        print(f"[API] Coordinator error: {str(coord_error)}")
+        raise
+    
+    # Update progress during execution
+    await progress_store.set(task_id, {
+        "status": "analyzing",
+        "phase": "analysis",
+        "progress": 50,
+        "message": "Analyzer Agent calculating risk scores..."
+    })
+    
+    # Broadcast progress update
+    await ws_manager.broadcast_progress(
+        task_id=task_id,
+        status="analyzing",
+        progress=50,
+        message="Analyzer Agent calculating risk scores..."
+    )
+    
+    # Calculate time taken
+    time_taken = (datetime.now() - start_time).total_seconds()
+    print(f"[API] Hunt completed in {time_taken:.2f} seconds")
+    print(f"[API] Found {len(result.get('results', {}).get('discovery', {}).get('top_opportunities', []))} pools")
+    
+    # Add execution metadata
+    result['execution_time'] = time_taken
+    result['agents_used'] = ['scanner', 'analyzer', 'monitor', 'coordinator']
+    
+    # Cache result
+    await rate_limiter.cache_response(rate_limiter.make_key("hunt", sanitized_query), result)
+    
+    return result
 
 @app.post("/hunt")
 @perf_monitor.track_execution("hunt_yields")
@@ -183,89 +358,86 @@ async def hunt_yields(request: HuntRequest):
     try:
         print(f"[Hunt] Received request with query: {request.query}")
         # Validate input
-        if not request.query or len(request.query.strip()) == 0:
-            raise HTTPException(status_code=400, detail="Query cannot be empty")
-        
-        if len(request.query) > 500:
-            raise HTTPException(status_code=400, detail="Query too long (max 500 characters)")
+        sanitized_query = _validate_hunt_query(request.query)
         
-        # Sanitize query
-        sanitized_query = request.query.strip()
-        
-        # Check rate limit
-        check_api_limit("/api/hunt")
-        
-        # Check cache
-        cache_key = hashlib.md5(sanitized_query.encode()).hexdigest()
-        cached = rate_limiter.get_cached_response(f"hunt_{cache_key}")
+        # Check cache (keyed by the query itself) - cached hits don't count toward the rate limit
+        cached = await rate_limiter.get_cached_response(rate_limiter.make_key("hunt", sanitized_query))
         if cached:
             return {**cached, "cached": True}
         
-        # Add debug logging
-        print(f"[API] Starting hunt with sanitized query: {sanitized_query}")
-        start_time = datetime.now()
-        
         # Create task ID for progress tracking
-        task_id = f"hunt_{cache_key}"
-        
-        print(f"[API] Calling coordinator.hunt_opportunities...")
-        progress_tracker[task_id] = {
-            "status": "scanning",
-            "phase": "discovery",
-            "progress": 10,
-            "message": "Scanner Agent discovering pools..."
-        }
-        
-        # Broadcast progress via WebSocket
-        await ws_manager.broadcast_progress(
-            task_id=task_id,
-            status="scanning",
-            progress=10,
-            message="Scanner Agent discovering pools..."
-        )
+        task_id = _hunt_task_id(sanitized_query)
         
-        # Execute hunt with progress updates
-        print("[API] Phase 1: Scanner Agent starting...")
-        try:
-            result = coordinator.hunt_opportunities(sanitized_query)
-            print(f"[API] Coordinator returned: {result.get('success', False)}")
-        except Exception as coord_error:
-            print(f"[API] Coordinator error: {str(coord_error)}")
-            raise
-        
-        # Update progress during execution
-        progress_tracker[task_id] = {
-            "status": "analyzing",
-            "phase": "analysis",
-            "progress": 50,
-            "message": "Analyzer Agent calculating risk scores..."
-        }
+        async def compute():
+            await check_api_limit("/api/hunt")
+            return await _execute_hunt(sanitized_query, task_id)
         
-        # Broadcast progress update
-        await ws_manager.broadcast_progress(
-            task_id=task_id,
-            status="analyzing",
-            progress=50,
-            message="Analyzer Agent calculating risk scores..."
-        )
+        # Concurrent identical hunts share one execution
+        return await request_coalescer.run(task_id, compute)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"[API] Hunt error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/hunt/async")
+async def hunt_yields_async(request: HuntRequest):
+    """Queue a hunt and return a task ID to poll via /progress/{task_id}"""
+    try:
+        sanitized_query = _validate_hunt_query(request.query)
         
-        # Calculate time taken
-        time_taken = (datetime.now() - start_time).total_seconds()
-        print(f"[API] Hunt completed in {time_taken:.2f} seconds")
-        print(f"[API] Found {len(result.get('results', {}).get('discovery', {}).get('top_opportunities', []))} pools")
+        task_id = _hunt_task_id(sanitized_query)
         
-        # Add execution metadata
-        result['execution_time'] = time_taken
-        result['agents_used'] = ['scanner', 'analyzer', 'monitor', 'coordinator']
+        # Serve cached results without queueing
+        cached = await rate_limiter.get_cached_response(rate_limiter.make_key("hunt", sanitized_query))
+        if cached:
+            await progress_store.set(task_id, {
+                "status": "complete",
+                "phase": "done",
+                "progress": 100,
+                "message": "Hunt complete (cached)",
+                "result": {**cached, "cached": True}
+            })
+            return {"task_id": task_id, "status": "complete"}
+        
+        # Identical query already queued or running - share it, unless its progress has gone stale
+        progress = await progress_store.get(task_id) or {}
+        current = progress.get("status")
+        if current in ("queued", "scanning", "analyzing") and \
+                time.time() - progress.get("updated_at", 0) < HUNT_PROGRESS_STALE_SECONDS:
+            return {"task_id": task_id, "status": current}
+        
+        # Check rate limit - only new executions consume a token
+        await check_api_limit("/api/hunt")
+        
+        async def job():
+            try:
+                # Records complete/failed progress itself
+                await _execute_hunt(sanitized_query, task_id)
+            except Exception as e:
+                print(f"[API] Queued hunt error: {str(e)}")
+        
+        # Written before submitting so it can't overwrite a worker that has already started
+        await progress_store.set(task_id, {
+            "status": "queued",
+            "phase": "queued",
+            "progress": 0,
+            "message": "Waiting for an available agent worker..."
+        })
         
-        # Cache result
-        rate_limiter.cache_response(f"hunt_{cache_key}", result)
+        if not task_queue.submit(task_id, job):
+            await progress_store.set(task_id, {
+                "status": "failed",
+                "phase": "error",
+                "progress": 100,
+                "message": "Hunt queue is full"
+            })
+            raise HTTPException(status_code=503, detail="Hunt queue is full. Try again shortly.")
         
-        return result
+        return {"task_id": task_id, "status": "queued"}
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[API] Hunt error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/scan/raydium")
@@ -273,18 +445,13 @@ async def hunt_yields(request: HuntRequest):
 async def scan_raydium(request: ScanRequest):
     """Scan Raydium for pools with REAL Solana addresses"""
     try:
-        from tools.raydium_scanner import RadiumScannerTool
-        raydium_scanner = RadiumScannerTool()
-        
         # Run Raydium scan
-        result = raydium_scanner._run(
+        scan_data = await run_blocking(
+            raydium_scanner.scan_pools,
             min_apy=request.min_apy,
             min_tvl=10000  # Minimum $10k TVL
         )
         
-        # Parse result
-        scan_data = json.loads(result)
-        
         return {
             "source": "Raydium Direct",
             "found_pools": scan_data.get("found_pools", 0),
@@ -304,34 +471,39 @@ async def scan_opportunities(request: ScanRequest):
         if request.min_apy < 0 or request.min_apy > 100000:
             raise HTTPException(status_code=400, detail="Invalid APY range (0-100000)")
         
-        # Check rate limit
-        check_api_limit("/api/scan")
-        
-        # Check cache
-        cache_key = f"scan_{request.min_apy}_{request.max_age_hours}"
-        cached = rate_limiter.get_cached_response(cache_key)
+        # Check cache - cached hits don't count toward the rate limit
+        cache_key = rate_limiter.make_key("scan", request.min_apy, request.max_age_hours)
+        cached = await rate_limiter.get_cached_response(cache_key)
         if cached:
             return {**cached, "cached": True}
         
-        # Execute scan
-        result = scanner.scan_new_opportunities(
-            min_apy=request.min_apy,
-            max_age_hours=request.max_age_hours
-        )
-        
-        # Transform to expected format
-        scan_response = {
-            "source": "Scanner Agent",
-            "found_pools": result.get("pools_found", 0),
-            "pools": result.get("opportunities", []),
-            "scan_time": datetime.now().isoformat(),
-            "data_sources": ["Helius RPC", "Jupiter", "DeFi Llama"]
-        }
-        
-        # Cache result
-        rate_limiter.cache_response(cache_key, scan_response)
+        async def compute():
+            await check_api_limit("/api/scan")
+            
+            # Execute scan
+            scanner = await load_agent(get_scanner)
+            result = await run_blocking(
+                scanner.scan_new_opportunities,
+                min_apy=request.min_apy,
+                max_age_hours=request.max_age_hours
+            )
+            
+            # Transform to expected format
+            scan_response = {
+                "source": "Scanner Agent",
+                "found_pools": result.get("pools_found", 0),
+                "pools": result.get("opportunities", []),
+                "scan_time": datetime.now().isoformat(),
+                "data_sources": ["Helius RPC", "Jupiter", "DeFi Llama"]
+            }
+            
+            # Cache result
+            await rate_limiter.cache_response(cache_key, scan_response)
+            
+            return scan_response
         
-        return scan_response
+        # Concurrent identical scans share one execution
+        return await request_coalescer.run(cache_key, compute)
     except HTTPException:
         raise
     except Exception as e:
@@ -346,7 +518,6 @@ async def smart_scan(request: HuntRequest):
         
         # Extract APY from query
         min_apy = 500  # Default
-        import re
         
         # Look for APY patterns
         apy_patterns = [
@@ -383,19 +554,13 @@ async def smart_scan(request: HuntRequest):
         
         print(f"[Smart Scan] Extracted: APY={min_apy}, TVL={min_tvl}")
         
-        # Use Raydium scanner directly
-        from tools.raydium_scanner import RadiumScannerTool
-        raydium_scanner = RadiumScannerTool()
-        
-        # Run scan
-        result = raydium_scanner._run(
+        # Run scan with the Raydium scanner directly
+        scan_data = await run_blocking(
+            raydium_scanner.scan_pools,
             min_apy=min_apy,
             min_tvl=min_tvl
         )
         
-        # Parse result
-        scan_data = json.loads(result)
-        
         return {
             "source": "Smart Scanner",
             "found_pools": scan_data.get("found_pools", 0),
@@ -413,153 +578,184 @@ async def smart_scan(request: HuntRequest):
         print(f"[Smart Scan] Error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/analyze")
-@perf_monitor.track_execution("analyze_pool")
-async def analyze_pool(request: AnalyzeRequest):
-    """Direct analyzer agent access with enhanced scoring"""
-    try:
-        # Check rate limit
-        check_api_limit("/api/analyze")
-        
-        # Try to fetch real pool data from Raydium
-        pool_data = None
-        try:
-            # First try to get from Raydium API
-            from utils.cache import api_cache
-            from utils.http_client import http_client
-            
-            # Check cache for recent Raydium data
-            cached_pools = api_cache.get("raydium_pools")
-            if cached_pools:
-                # Find the specific pool
-                for pool in cached_pools:
-                    if pool.get("ammId") == request.pool_address:
-                        # Found it! Extract real data
-                        pool_data = {
-                            "pool_address": request.pool_address,
-                            "protocol": "raydium",
-                            "token_a": pool.get("name", "").split("-")[0] if "-" in pool.get("name", "") else "UNKNOWN",
-                            "token_b": pool.get("name", "").split("-")[1] if "-" in pool.get("name", "") else "SOL",
-                            "token_symbols": pool.get("name", "UNKNOWN/SOL"),
-                            "apy": float(pool.get("apy", 0)) * 100 if pool.get("apy") else 850.0,
-                            "tvl": float(pool.get("liquidity", 125000)),
-                            "volume_24h": float(pool.get("volume24h", 45000)),
-                            "age_hours": 24,  # Default, would need on-chain data
-                            "liquidity_locked": False,
-                            "source": "Raydium_Live"
-                        }
-                        break
-            
-            # If not found in cache, fetch fresh data
-            if not pool_data:
-                response = http_client.get("https://api.raydium.io/v2/main/pairs", timeout=5)
-                if response.status_code == 200:
-                    pools = response.json()
-                    for pool in pools:
-                        if pool.get("ammId") == request.pool_address:
-                            # Calculate APY from volume and fees
-                            liquidity = float(pool.get("liquidity", 0))
-                            volume_24h = float(pool.get("volume24h", 0))
-                            apy = 0
-                            if liquidity > 0:
-                                daily_fees = volume_24h * 0.0025
-                                daily_yield = (daily_fees / liquidity) * 100
-                                apy = daily_yield * 365
-                            
-                            pool_data = {
-                                "pool_address": request.pool_address,
-                                "protocol": "raydium",
-                                "token_a": pool.get("name", "").split("-")[0] if "-" in pool.get("name", "") else "UNKNOWN",
-                                "token_b": pool.get("name", "").split("-")[1] if "-" in pool.get("name", "") else "SOL",
-                                "token_symbols": pool.get("name", "UNKNOWN/SOL"),
-                                "apy": round(apy, 2),
-                                "tvl": round(liquidity, 2),
-                                "volume_24h": round(volume_24h, 2),
-                                "age_hours": 24,
-                                "liquidity_locked": False,
-                                "source": "Raydium_Fresh"
-                            }
-                            break
-        except Exception as e:
-            print(f"[Analyze] Error fetching pool data: {e}")
-        
-        # Fallback to basic data if not found
-        if not pool_data:
-            pool_data = {
-                "pool_address": request.pool_address,
-                "protocol": "raydium",
-                "token_a": "UNKNOWN",
-                "token_b": "SOL",
-                "token_symbols": "UNKNOWN/SOL",
-                "apy": 850.0,
-                "tvl": 125000,
-                "volume_24h": 45000,
-                "age_hours": 12,
-                "creator": request.pool_address[:8] + "...",
-                "liquidity_locked": False,
-                "source": "Fallback_Data"
-            }
-        
-        # Log pool data for debugging
-        print(f"[Analyze] Analyzing pool {request.pool_address}")
-        print(f"[Analyze] Pool data source: {pool_data.get('source')}")
-        print(f"[Analyze] APY: {pool_data.get('apy')}%, TVL: ${pool_data.get('tvl'):,.0f}")
-        
-        # Use DegenScorerTool directly for detailed scoring
-        from tools.degen_scorer import DegenScorerTool
-        scorer = DegenScorerTool()
-        score_result = scorer._run(request.pool_address, pool_data)
-        
-        # Parse the score result
-        try:
-            score_data = json.loads(score_result)
-            print(f"[Analyze] Degen score: {score_data.get('degen_score')}/10")
-        except Exception as e:
-            print(f"[Analyze] Score parsing error: {e}")
-            score_data = {"error": "Failed to calculate score"}
-        
-        # Run the analyzer agent for narrative analysis
-        analysis_result = analyzer.analyze_pool(pool_data)
-        
-        # Combine results
-        response_data = {
-            "success": True,
-            "agent": "AnalyzerAgent",
-            "result": f"""
+# Text report returned by /analyze; missing score fields fall back to ANALYSIS_REPORT_DEFAULTS
+ANALYSIS_REPORT_TEMPLATE = """
 🔍 POOL ANALYSIS COMPLETE
 
-{score_data.get('analysis_summary', 'No summary available')}
+{analysis_summary}
 
-📊 DEGEN SCORE: {score_data.get('degen_score', 'N/A')}/10
-🎯 RISK LEVEL: {score_data.get('risk_level', 'UNKNOWN')}
+📊 DEGEN SCORE: {degen_score}/10
+🎯 RISK LEVEL: {risk_level}
 
 💡 SCORE BREAKDOWN:
-- Liquidity Score: {score_data.get('score_breakdown', {}).get('liquidity_score', 0):.1f}/10
-- Volume Score: {score_data.get('score_breakdown', {}).get('volume_score', 0):.1f}/10
-- Age Score: {score_data.get('score_breakdown', {}).get('age_score', 0):.1f}/10
-- APY Sustainability: {score_data.get('score_breakdown', {}).get('apy_sustainability', 0):.1f}/10
+- Liquidity Score: {liquidity_score:.1f}/10
+- Volume Score: {volume_score:.1f}/10
+- Age Score: {age_score:.1f}/10
+- APY Sustainability: {apy_sustainability:.1f}/10
 
 🚨 RED FLAGS:
-{chr(10).join(score_data.get('red_flags', ['None detected']))}
+{red_flags}
 
 📌 RECOMMENDATION:
-{score_data.get('recommendation', 'Unable to generate recommendation')}
+{recommendation}
 
 💭 AGENT ANALYSIS:
-{analysis_result.get('analysis_result', 'No additional analysis available')}
-""",
-            "pool_data": pool_data,
-            "score_data": score_data,
-            "analysis_data": analysis_result
+{agent_analysis}
+"""
+
+ANALYSIS_REPORT_DEFAULTS = {
+    "analysis_summary": "No summary available",
+    "degen_score": "N/A",
+    "risk_level": "UNKNOWN",
+    "liquidity_score": 0,
+    "volume_score": 0,
+    "age_score": 0,
+    "apy_sustainability": 0,
+    "recommendation": "Unable to generate recommendation"
+}
+
+def _format_analysis_report(score_data: Dict[str, Any], analysis_result: Dict[str, Any]) -> str:
+    """Render the /analyze text report from scorer and analyzer output"""
+    return ANALYSIS_REPORT_TEMPLATE.format_map(ChainMap(
+        {
+            "red_flags": "\n".join(score_data.get('red_flags') or ['None detected']),
+            "agent_analysis": analysis_result.get('analysis_result', 'No additional analysis available')
+        },
+        score_data,
+        score_data.get('score_breakdown', {}),
+        ANALYSIS_REPORT_DEFAULTS
+    ))
+
+def _pool_tokens(pool: Dict[str, Any]) -> tuple:
+    """(token_a, token_b) from a Raydium pair name like "BONK-USDC", split once"""
+    name = pool.get("name", "")
+    if "-" not in name:
+        return "UNKNOWN", "SOL"
+    parts = name.split("-", 2)
+    return parts[0], parts[1]
+
+async def _execute_analysis(request: AnalyzeRequest) -> Dict[str, Any]:
+    """Fetch pool data, score it and run the analyzer agent"""
+    # Try to fetch real pool data from Raydium
+    pool_data = None
+    try:
+        # First try to get from Raydium API
+        # Check cache for recent Raydium data (indexed by ammId)
+        pools_by_id = api_cache.get(RAYDIUM_POOLS_BY_ID_KEY)
+        pool = pools_by_id.get(request.pool_address) if pools_by_id else None
+        if pool:
+            # Found it! Extract real data
+            token_a, token_b = _pool_tokens(pool)
+            pool_data = {
+                "pool_address": request.pool_address,
+                "protocol": "raydium",
+                "token_a": token_a,
+                "token_b": token_b,
+                "token_symbols": pool.get("name", "UNKNOWN/SOL"),
+                "apy": float(pool.get("apy", 0)) * 100 if pool.get("apy") else 850.0,
+                "tvl": float(pool.get("liquidity", 125000)),
+                "volume_24h": float(pool.get("volume24h", 45000)),
+                "age_hours": 24,  # Default, would need on-chain data
+                "liquidity_locked": False,
+                "source": "Raydium_Live"
+            }
+        
+        # If not found in cache, fetch fresh data
+        if not pool_data:
+            response = await get_async_http_client().get("https://api.raydium.io/v2/main/pairs", timeout=5)
+            if response.status_code == 200:
+                # Decode and index off the event loop; the index also serves later lookups
+                pools_by_id = await run_blocking(lambda: cache_raydium_pools(response.json()))
+                pool = pools_by_id.get(request.pool_address)
+                if pool:
+                    # Calculate APY from volume and fees
+                    liquidity = float(pool.get("liquidity", 0))
+                    volume_24h = float(pool.get("volume24h", 0))
+                    apy = 0
+                    if liquidity > 0:
+                        daily_fees = volume_24h * 0.0025
+                        daily_yield = (daily_fees / liquidity) * 100
+                        apy = daily_yield * 365
+                    
+                    token_a, token_b = _pool_tokens(pool)
+                    pool_data = {
+                        "pool_address": request.pool_address,
+                        "protocol": "raydium",
+                        "token_a": token_a,
+                        "token_b": token_b,
+                        "token_symbols": pool.get("name", "UNKNOWN/SOL"),
+                        "apy": round(apy, 2),
+                        "tvl": round(liquidity, 2),
+                        "volume_24h": round(volume_24h, 2),
+                        "age_hours": 24,
+                        "liquidity_locked": False,
+                        "source": "Raydium_Fresh"
+                    }
+    except Exception as e:
+        print(f"[Analyze] Error fetching pool data: {e}")
+    
+    # Fallback to basic data if not found
+    if not pool_data:
+        pool_data = {
+            "pool_address": request.pool_address,
+            "protocol": "raydium",
+            "token_a": "UNKNOWN",
+            "token_b": "SOL",
+            "token_symbols": "UNKNOWN/SOL",
+            "apy": 850.0,
+            "tvl": 125000,
+            "volume_24h": 45000,
+            "age_hours": 12,
+            "creator": request.pool_address[:8] + "...",
+            "liquidity_locked": False,
+            "source": "Fallback_Data"
         }
+    
+    # Log pool data for debugging
+    print(f"[Analyze] Analyzing pool {request.pool_address}")
+    print(f"[Analyze] Pool data source: {pool_data.get('source')}")
+    print(f"[Analyze] APY: {pool_data.get('apy')}%, TVL: ${pool_data.get('tvl'):,.0f}")
+    
+    # Use DegenScorerTool directly for detailed scoring
+    try:
+        score_data = await run_blocking(degen_scorer.score_pool, request.pool_address, pool_data)
+        print(f"[Analyze] Degen score: {score_data.get('degen_score')}/10")
+    except Exception as e:
+        print(f"[Analyze] Scoring error: {e}")
+        score_data = {"error": "Failed to calculate score"}
+    
+    # Run the analyzer agent for narrative analysis
+    analyzer = await load_agent(get_analyzer)
+    analysis_result = await run_blocking(analyzer.analyze_pool, pool_data)
+    
+    # Combine results
+    response_data = {
+        "success": True,
+        "agent": "AnalyzerAgent",
+        "result": _format_analysis_report(score_data, analysis_result),
+        "pool_data": pool_data,
+        "score_data": score_data,
+        "analysis_data": analysis_result
+    }
+    
+    print(f"[Analyze] Returning analysis for {request.pool_address}")
+    return response_data
+
+@app.post("/analyze")
+@perf_monitor.track_execution("analyze_pool")
+async def analyze_pool(request: AnalyzeRequest):
+    """Direct analyzer agent access with enhanced scoring"""
+    try:
+        async def compute():
+            await check_api_limit("/api/analyze")
+            return await _execute_analysis(request)
         
-        print(f"[Analyze] Returning analysis for {request.pool_address}")
-        return response_data
+        # Concurrent requests for the same pool share one analysis
+        return await request_coalescer.run(f"analyze_{request.pool_address}", compute)
     except HTTPException:
         raise
     except Exception as e:
         print(f"[Analyze] Error: {str(e)}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -568,17 +764,13 @@ async def enter_position(request: AddPositionRequest):
     """Enter a new position"""
     try:
         # Use enhanced monitor to add position
-        result = enhanced_monitor.monitored_positions
+        enhanced_monitor = await load_agent(get_enhanced_monitor)
         
         # Enter position through position manager
         position = position_manager.enter_position(request.pool_data, request.amount)
         
         # Start monitoring
-        enhanced_monitor.monitored_positions[position.id] = {
-            "position": position,
-            "last_check": datetime.now(),
-            "alerts": []
-        }
+        enhanced_monitor.monitored_positions[position.id] = MonitorEntry(position, datetime.now())
         
         return {
             "success": True,
@@ -592,14 +784,8 @@ async def enter_position(request: AddPositionRequest):
 async def exit_position(request: ExitPositionRequest):
     """Exit a position"""
     try:
-        from models.position import ExitReason
-        
         # Parse exit reason
-        exit_reason = ExitReason.MANUAL
-        for reason in ExitReason:
-            if reason.value == request.reason:
-                exit_reason = reason
-                break
+        exit_reason = ExitReason.from_value(request.reason, ExitReason.MANUAL)
         
         # Exit position
         position = position_manager.exit_position(request.position_id, exit_reason)
@@ -615,17 +801,18 @@ async def exit_position(request: ExitPositionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/positions")
-async def get_positions():
+async def get_positions(request: Request):
     """Get all positions"""
     try:
-        active = position_manager.get_active_positions()
-        summary = position_manager.get_position_summary()
+        def build():
+            return {
+                "active_positions": [p.dict() for p in position_manager.get_active_positions()],
+                "position_history": [p.dict() for p in position_manager.position_history],
+                "summary": position_manager.get_position_summary().dict()
+            }
         
-        return {
-            "active_positions": [p.dict() for p in active],
-            "position_history": [p.dict() for p in position_manager.position_history],
-            "summary": summary.dict()
-        }
+        # Unchanged polls are answered from the version counter without building the payload
+        return versioned_json_response(request, position_manager.version, build, max_age=2)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -633,22 +820,24 @@ async def get_positions():
 async def get_position(position_id: str):
     """Get specific position details"""
     try:
+        enhanced_monitor = await load_agent(get_enhanced_monitor)
         report = enhanced_monitor.get_position_report(position_id)
         return report
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/monitor/check")
+@app.get("/monitor/check", dependencies=[Depends(concurrency_guard("/monitor/check"))])
 async def check_positions():
     """Check all monitored positions"""
     try:
         # Check rate limit
-        check_api_limit("/api/monitor/check")
+        await check_api_limit("/api/monitor/check")
         
         # Update all positions with real data
-        position_manager.update_all_positions()
+        await refresh_positions()
         
-        # Use enhanced monitor
+        # Use enhanced monitor (CPU only - runs on the loop since it updates positions)
+        enhanced_monitor = await load_agent(get_enhanced_monitor)
         result = enhanced_monitor.monitor_all_positions()
         
         return result
@@ -657,28 +846,28 @@ async def check_positions():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/performance")
+@app.get("/performance", dependencies=[Depends(concurrency_guard("/performance"))])
 async def get_performance_metrics():
     """Get detailed performance metrics with real pool data"""
     try:
-        # Update positions with latest data
-        position_manager.update_all_positions()
+        # Update positions with latest data (one pool fetch for all positions)
+        pool_metrics = await refresh_positions()
         
         # Get position summary
         summary = position_manager.get_position_summary()
         
-        # Get active positions with current metrics
+        # Get active positions with current metrics (one clock read for the whole response)
+        now = datetime.now()
         active_positions = []
         for pos in position_manager.get_active_positions():
-            # Get real-time pool data
-            current_metrics = position_manager._fetch_real_pool_metrics(pos.pool_address)
+            current_metrics = pool_metrics.get(pos.pool_address, {})
             
             active_positions.append({
                 "position_id": pos.id,
                 "pool": pos.pool_data.get("token_symbols", "Unknown"),
                 "pool_address": pos.pool_address,
                 "entry_time": pos.entry_time.isoformat(),
-                "hours_held": (datetime.now() - pos.entry_time).total_seconds() / 3600,
+                "hours_held": (now - pos.entry_time).total_seconds() / 3600,
                 "entry_amount": pos.entry_amount,
                 "current_value": pos.current_value,
                 "pnl_amount": pos.pnl_amount,
@@ -707,13 +896,14 @@ async def get_performance_metrics():
                 "exit_reason": pos.exit_reason.value if pos.exit_reason else None
             })
         
+        # No ETag: last_update and hours_held change on every call, so it could never match
         return {
             "summary": summary.dict(),
             "active_positions": active_positions,
             "historical_positions": historical_positions,
             "wallet_balance": position_manager.wallet.get_balance(),
-            "total_gas_spent": sum(p.gas_spent for p in position_manager.positions.values()),
-            "last_update": datetime.now().isoformat()
+            "total_gas_spent": position_manager.total_gas_spent,
+            "last_update": now.isoformat()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -721,8 +911,6 @@ async def get_performance_metrics():
 @app.get("/stats")
 async def get_stats():
     """Get system performance statistics"""
-    from utils.cache import api_cache
-    
     # Calculate stats
     active_positions = position_manager.get_active_positions()
     total_value = sum(p.current_value for p in active_positions)
@@ -757,19 +945,24 @@ async def get_stats():
     }
 
 @app.get("/system/status")
-async def system_status():
+async def system_status(request: Request):
     """Get multi-agent system status"""
     try:
-        result = coordinator.get_system_status()
-        return result
+        # Status only changes every few seconds, so share one snapshot across polls
+        result = api_cache.get("system_status")
+        if result is None:
+            coordinator = await load_agent(get_coordinator)
+            result = coordinator.get_system_status()
+            api_cache.set("system_status", result, ttl_seconds=5)
+        return cached_json_response(request, result, max_age=5)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/system/rate-limits")
-async def get_rate_limit_status():
+async def get_rate_limit_status(request: Request):
     """Get current rate limit usage"""
-    return {
-        "usage": rate_limiter.get_usage_stats(),
+    return cached_json_response(request, {
+        "usage": await rate_limiter.get_usage_stats(),
         "limits": {
             "openrouter_per_minute": Config.OPENROUTER_RATE_LIMIT,
             "helius_per_minute": Config.HELIUS_RATE_LIMIT,
@@ -778,66 +971,87 @@ async def get_rate_limit_status():
         },
         "caching_enabled": Config.ENABLE_CACHING,
         "cache_ttl_seconds": Config.CACHE_TTL
-    }
+    }, max_age=2)
 
 @app.get("/wallet")
-async def get_wallet_info():
+async def get_wallet_info(request: Request):
     """Get wallet balance and performance metrics"""
     try:
         wallet = get_wallet()
-        # Debug logging
-        balance = wallet.get_balance()
-        available = wallet.get_available_balance()
-        print(f"[Wallet] Balance: ${balance}, Available: ${available}, Initial: ${wallet.initial_balance}")
         
-        return {
-            "balance": balance,
-            "initial_balance": wallet.initial_balance,
-            "available_balance": available,
-            "performance": wallet.get_performance_metrics().to_dict(),
-            "transaction_count": len(wallet.transactions)
-        }
+        def build():
+            # Debug logging
+            balance = wallet.get_balance()
+            available = wallet.get_available_balance()
+            print(f"[Wallet] Balance: ${balance}, Available: ${available}, Initial: ${wallet.initial_balance}")
+            
+            return {
+                "balance": balance,
+                "initial_balance": wallet.initial_balance,
+                "available_balance": available,
+                "performance": wallet.get_performance_metrics().to_dict(),
+                "transaction_count": len(wallet.transactions)
+            }
+        
+        return versioned_json_response(request, wallet.version, build, max_age=2)
     except Exception as e:
         print(f"[Wallet] Error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Transactions serialized per streamed chunk
+TRANSACTION_STREAM_CHUNK = 100
+
 @app.get("/wallet/transactions")
 async def get_wallet_transactions(
     limit: int = 50,
     offset: int = 0,
-    position_id: Optional[str] = None
+    position_id: Optional[str] = None,
+    after: Optional[str] = None
 ):
-    """Get wallet transaction history"""
+    """Get wallet transaction history; pass next_cursor back as `after` for the next page"""
     try:
         wallet = get_wallet()
-        transactions = wallet.get_transactions(limit, offset, position_id)
-        return {
-            "transactions": [t.to_dict() for t in transactions],
+        transactions = wallet.get_transactions(limit, offset, position_id, after)
+        page_info = {
             "total": len(wallet.transactions),
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": transactions[-1].id if transactions and len(transactions) == limit else None
         }
+        
+        # Stream the array in chunks so large pages never hold every dict plus the full JSON buffer
+        async def stream():
+            yield b'{"transactions":['
+            for start in range(0, len(transactions), TRANSACTION_STREAM_CHUNK):
+                chunk = transactions[start:start + TRANSACTION_STREAM_CHUNK]
+                body = b",".join(orjson.dumps(t.to_dict()) for t in chunk)
+                yield body if start == 0 else b"," + body
+            yield b"]," + orjson.dumps(page_info)[1:]
+        
+        return StreamingResponse(stream(), media_type="application/json")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/wallet/performance")
-async def get_wallet_performance():
+async def get_wallet_performance(request: Request):
     """Get detailed wallet performance metrics"""
     try:
         wallet = get_wallet()
         metrics = wallet.get_performance_metrics()
         
         # Add additional context
-        return {
+        return cached_json_response(request, {
             "metrics": metrics.to_dict(),
             "current_balance": wallet.get_balance(),
             "initial_balance": wallet.initial_balance,
-            "all_time_high": max(wallet.balance, wallet.initial_balance),  # Simple ATH
+            "all_time_high": wallet.all_time_high,
             "position_count": {
                 "active": len(position_manager.get_active_positions()),
                 "total": len(position_manager.positions) + len(position_manager.position_history)
             }
-        }
+        }, max_age=2)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -850,8 +1064,7 @@ async def reset_wallet():
         wallet.reset()
         
         # Also reset position manager
-        position_manager.positions.clear()
-        position_manager.position_history.clear()
+        position_manager.reset()
         
         return {
             "success": True,
@@ -939,7 +1152,6 @@ async def get_pool_risk_analysis(pool_address: str):
             return {"data": cached, "cached": True}
         
         # Fetch from database
-        from database.connection import get_db_connection
         conn = await get_db_connection()
         try:
             query = """
@@ -975,7 +1187,6 @@ async def get_pool_risk_analysis(pool_address: str):
 async def get_recent_risk_analyses(limit: int = 20):
     """Get recent risk analyses for all pools"""
     try:
-        from database.connection import get_db_connection
         conn = await get_db_connection()
         try:
             query = """
@@ -1351,7 +1562,6 @@ async def startup_event():
         print("[Startup] Database pool initialized successfully")
     except Exception as e:
         print(f"[Startup] Database initialization failed: {e}")
-        import traceback
         traceback.print_exc()
         # Continue running even if DB fails - for debugging
         pass
@@ -1375,6 +1585,17 @@ async def startup_event():
     asyncio.create_task(risk_analysis_service.start())
     print("[Startup] Risk Analysis Service started")
     
+    # Optionally build all agents up front - in parallel, off the event loop
+    if Config.PRELOAD_AGENTS:
+        await asyncio.gather(*(
+            run_blocking(factory) for factory in (*AGENT_FACTORIES.values(), get_enhanced_monitor)
+        ))
+        print("[Startup] Agents preloaded")
+    
+    # Start workers for queued hunts
+    await task_queue.start()
+    print("[Startup] Task Queue started")
+    
     # Don't auto-start trading bot - let user control it
     print("[Startup] Trading Bot ready (manual start required)")
 
@@ -1383,9 +1604,20 @@ async def shutdown_event():
     """Stop background services"""
     await risk_analysis_service.stop()
     await trading_bot.stop()
+    # Hunts that won't finish shouldn't look in progress to other workers sharing the store
+    for task_id in await task_queue.stop():
+        await progress_store.set(task_id, {
+            "status": "failed",
+            "phase": "error",
+            "progress": 100,
+            "message": "Hunt cancelled by server shutdown"
+        })
+    await close_redis()
+    await close_async_http_client()
     await db.close_pool()
+    agent_executor.shutdown(wait=False)
     print("[Shutdown] Services stopped")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
\ No newline at end of file
@@ -1,16 +1,48 @@
+import hashlib
+import math
 import time
-from typing import Dict, Optional
+import uuid
+import orjson
+from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from collections import OrderedDict, defaultdict, deque
 from config import Config
+from utils.redis_client import get_redis
+from redis.exceptions import RedisError
+
+# Atomic token bucket: refill by elapsed time, then try to take `cost` tokens.
+# Returns {allowed, seconds_to_wait}; wait is a string since Lua numbers are truncated to ints.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    wait = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(wait)}
+"""
 
 class RateLimiter:
     """Simple in-memory rate limiter to prevent API abuse and save credits"""
     
     def __init__(self):
-        # Track API calls per endpoint
-        self.call_history: Dict[str, deque] = defaultdict(lambda: deque())
+        # Per-endpoint token buckets: [tokens, last refill (time.monotonic())], same model as the Redis script
+        self.buckets: Dict[str, List[float]] = {}
         
         # Define rate limits (calls per minute)
         self.rate_limits = {
@@ -23,83 +55,276 @@ class RateLimiter:
             "coingecko": Config.COINGECKO_RATE_LIMIT  # Free tier limit
         }
         
-        # Cache for API responses (5 minute TTL)
-        self.cache: Dict[str, Dict] = {}
+        # Cache for API responses (5 minute TTL), bounded with LRU eviction.
+        # With Redis configured this is a hot tier in front of the shared cache.
+        # Keyed by make_key() digests rather than the (possibly long) composite strings;
+        # entries are (data, expires_at) with expires_at on the time.monotonic() clock
+        self.cache: OrderedDict[bytes, Tuple[Dict, float]] = OrderedDict()
         self.cache_ttl = Config.CACHE_TTL if Config.ENABLE_CACHING else 0
+        self.cache_max_size = Config.RATE_LIMITER_CACHE_SIZE
+        # (expires_at, key) in insertion order - roughly expiry order (copies of Redis entries may
+        # expire sooner), so lookups still check each entry's own expiry
+        self._expiry: deque = deque()
+        
+        # Redis token bucket script, registered on first use
+        self._bucket_script = None
     
-    def check_rate_limit(self, key: str, limit: Optional[int] = None) -> bool:
-        """Check if request is within rate limit"""
-        now = datetime.now()
-        one_minute_ago = now - timedelta(minutes=1)
+    async def acquire(self, key: str, cost: int = 1) -> Tuple[bool, float]:
+        """Take a token for key, shared across workers via Redis when configured.
+        
+        Returns (allowed, seconds until a token is available).
+        """
+        limit = self.rate_limits.get(key, 60)
+        client = get_redis()
+        if client is None:
+            # Per-process fallback
+            return self._take_tokens(key, limit, cost)
         
-        # Clean old entries
-        while self.call_history[key] and self.call_history[key][0] < one_minute_ago:
-            self.call_history[key].popleft()
+        if self._bucket_script is None:
+            self._bucket_script = client.register_script(TOKEN_BUCKET_SCRIPT)
         
+        # Limits are per minute; bucket holds a full minute's worth of tokens
+        try:
+            allowed, wait = await self._bucket_script(
+                keys=[f"rl:{key}"],
+                args=[limit / 60, limit, time.time(), cost],
+                client=client
+            )
+        except RedisError as e:
+            # Keep limiting (per process) rather than failing requests while Redis is unreachable
+            print(f"[RateLimiter] Redis unavailable, using local bucket for {key}: {e}")
+            return self._take_tokens(key, limit, cost)
+        return bool(allowed), float(wait)
+    
+    def _refill(self, key: str, limit: int, now: Optional[float] = None) -> List[float]:
+        """Get key's bucket with tokens topped up for the time since the last refill"""
+        if now is None:
+            now = time.monotonic()
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = [float(limit), now]
+        else:
+            bucket[0] = min(limit, bucket[0] + (now - bucket[1]) * limit / 60)
+            bucket[1] = now
+        return bucket
+    
+    def _take_tokens(self, key: str, limit: int, cost: int = 1) -> Tuple[bool, float]:
+        """Take cost tokens from key's bucket; returns (allowed, seconds until enough tokens)"""
+        bucket = self._refill(key, limit)
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return True, 0.0
+        return False, (cost - bucket[0]) * 60 / limit
+    
+    def check_rate_limit(self, key: str, limit: Optional[int] = None) -> bool:
+        """Check if request is within rate limit"""
         # Get appropriate limit
         if limit is None:
             limit = self.rate_limits.get(key, 60)  # Default to 60 calls/min
         
-        # Check if under limit
-        if len(self.call_history[key]) >= limit:
-            return False
-        
-        # Record this call
-        self.call_history[key].append(now)
-        return True
+        allowed, _ = self._take_tokens(key, limit)
+        return allowed
+    
+    @staticmethod
+    def make_key(*parts) -> bytes:
+        """Build a fixed-size 16-byte cache key from the parts identifying a response"""
+        return hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=16).digest()
     
-    def get_cached_response(self, cache_key: str) -> Optional[Dict]:
+    async def get_cached_response(self, cache_key: bytes) -> Optional[Dict]:
         """Get cached response if available and not expired"""
         if not Config.ENABLE_CACHING:
             return None
-            
+        
+        self._sweep()
         cached = self.cache.get(cache_key)
-        if cached and time.time() - cached['timestamp'] < self.cache_ttl:
-            return cached['data']
+        if cached and cached[1] > time.monotonic():
+            self.cache.move_to_end(cache_key)
+            return cached[0]
         
         # Remove expired cache
         if cached:
             del self.cache[cache_key]
         
-        return None
+        # Shared across workers when Redis is configured
+        client = get_redis()
+        if client is None:
+            return None
+        
+        redis_key = f"cache:{cache_key.hex()}"
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.get(redis_key)
+                pipe.pttl(redis_key)
+                raw, ttl_ms = await pipe.execute()
+        except RedisError as e:
+            # Treat as a miss rather than failing the request
+            print(f"[RateLimiter] Redis unavailable, cache lookup missed: {e}")
+            return None
+        if not raw:
+            return None
+        
+        data = orjson.loads(raw)
+        # Keep a local copy, expiring with the shared one
+        if ttl_ms > 0:
+            self._store_local(cache_key, data, ttl_ms / 1000)
+        return data
     
-    def cache_response(self, cache_key: str, data: Dict):
-        """Cache a response with timestamp"""
+    async def cache_response(self, cache_key: bytes, data: Dict):
+        """Cache a response until the cache TTL elapses"""
         if Config.ENABLE_CACHING:
-            self.cache[cache_key] = {
-                'data': data,
-                'timestamp': time.time()
-            }
+            self._store_local(cache_key, data, self.cache_ttl)
+            
+            client = get_redis()
+            if client is not None:
+                try:
+                    await client.set(f"cache:{cache_key.hex()}", orjson.dumps(data, default=str), ex=self.cache_ttl)
+                except RedisError as e:
+                    # Still cached in this process
+                    print(f"[RateLimiter] Redis unavailable, response cached locally only: {e}")
     
-    def get_usage_stats(self) -> Dict:
-        """Get current usage statistics"""
+    def _store_local(self, cache_key: bytes, data: Dict, ttl: float):
+        """Put a response in the in-process cache for ttl seconds"""
+        self._sweep()
+        if cache_key in self.cache:
+            self.cache.move_to_end(cache_key)
+        elif len(self.cache) >= self.cache_max_size:
+            # Evict least recently used entry
+            self.cache.popitem(last=False)
+        
+        expires_at = time.monotonic() + ttl
+        self.cache[cache_key] = (data, expires_at)
+        self._expiry.append((expires_at, cache_key))
+    
+    async def get_usage_stats(self) -> Dict:
+        """Get current usage statistics, from the shared Redis buckets when configured"""
+        client = get_redis()
+        if client is not None:
+            try:
+                return await self._redis_usage_stats(client)
+            except RedisError as e:
+                print(f"[RateLimiter] Redis unavailable, reporting local usage: {e}")
+        
         stats = {}
-        now = datetime.now()
-        one_minute_ago = now - timedelta(minutes=1)
+        now = time.monotonic()
         
-        for key, history in self.call_history.items():
-            # Clean old entries
-            while history and history[0] < one_minute_ago:
-                history.popleft()
-            
+        for key in list(self.buckets):
             limit = self.rate_limits.get(key, 60)
-            stats[key] = {
-                'calls_last_minute': len(history),
-                'limit_per_minute': limit,
-                'usage_percentage': round((len(history) / limit) * 100, 2)
-            }
+            stats[key] = self._usage_entry(limit, self._refill(key, limit, now)[0])
+        
+        return stats
+    
+    async def _redis_usage_stats(self, client) -> Dict:
+        """Usage from the rl:{key} hashes written by TOKEN_BUCKET_SCRIPT"""
+        keys = list(self.rate_limits)
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hmget(f"rl:{key}", "tokens", "ts")
+            buckets = await pipe.execute()
+        
+        stats = {}
+        now = time.time()
+        for key, (tokens, ts) in zip(keys, buckets):
+            if tokens is None:
+                continue  # Unused (or expired, i.e. full) bucket
+            limit = self.rate_limits[key]
+            # Same refill as the script, without writing it back
+            tokens = min(limit, float(tokens) + max(0.0, now - float(ts)) * limit / 60)
+            stats[key] = self._usage_entry(limit, tokens)
         
         return stats
+    
+    @staticmethod
+    def _usage_entry(limit: int, tokens: float) -> Dict:
+        """Usage stats for one bucket"""
+        # Tokens missing from a full bucket approximate calls in the last minute
+        calls = round(limit - tokens)
+        return {
+            'calls_last_minute': calls,
+            'limit_per_minute': limit,
+            'usage_percentage': round((calls / limit) * 100, 2)
+        }
+    
+    def _sweep(self):
+        """Drop expired cache entries, visiting only the ones that have expired"""
+        now = time.monotonic()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, key = self._expiry.popleft()
+            cached = self.cache.get(key)
+            # Skip keys evicted or re-cached since this expiry was recorded
+            if cached and cached[1] <= now:
+                del self.cache[key]
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
-def check_api_limit(endpoint: str):
-    """Decorator to check rate limits before API calls"""
-    if not rate_limiter.check_rate_limit(endpoint):
-        wait_time = 60  # Wait 1 minute
+async def check_api_limit(endpoint: str):
+    """Check rate limits before API calls, raising 429 when exceeded"""
+    allowed, wait = await rate_limiter.acquire(endpoint)
+    if not allowed:
+        wait_time = max(1, math.ceil(wait))
         raise HTTPException(
             status_code=429,
             detail=f"Rate limit exceeded for {endpoint}. Try again in {wait_time} seconds. "
                    f"(Limit: {rate_limiter.rate_limits.get(endpoint, 60)} calls/min)"
-        )
\ No newline at end of file
+        )
+
+# In-flight requests older than this are assumed dead (worker crash) and dropped
+CONCURRENCY_STALE_SECONDS = 120
+
+# Per-process in-flight counts when Redis isn't configured
+_local_in_flight: Dict[str, int] = defaultdict(int)
+
+def concurrency_guard(route: str, limit: int = Config.RPC_MAX_CONCURRENT_REQUESTS):
+    """FastAPI dependency capping concurrent requests to an expensive endpoint"""
+    def reject():
+        raise HTTPException(
+            status_code=429,
+            detail=f"Too many concurrent requests for {route}. Try again shortly. "
+                   f"(Limit: {limit} in flight)"
+        )
+    
+    async def release(client, key: str, request_id: str):
+        try:
+            await client.zrem(key, request_id)
+        except RedisError as e:
+            # The member ages out after CONCURRENCY_STALE_SECONDS
+            print(f"[RateLimiter] Redis unavailable, could not release {route} slot: {e}")
+    
+    async def guard():
+        # Shared across workers: one sorted-set member per in-flight request
+        client = get_redis()
+        key = f"inflight:{route}"
+        request_id = uuid.uuid4().hex
+        if client is not None:
+            now = time.time()
+            try:
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.zremrangebyscore(key, 0, now - CONCURRENCY_STALE_SECONDS)
+                    pipe.zadd(key, {request_id: now})
+                    pipe.zcard(key)
+                    pipe.expire(key, CONCURRENCY_STALE_SECONDS)
+                    _, _, in_flight, _ = await pipe.execute()
+            except RedisError as e:
+                print(f"[RateLimiter] Redis unavailable, using local in-flight count for {route}: {e}")
+                client = None
+        
+        if client is None:
+            if _local_in_flight[route] >= limit:
+                reject()
+            _local_in_flight[route] += 1
+            try:
+                yield
+            finally:
+                _local_in_flight[route] -= 1
+            return
+        
+        if in_flight > limit:
+            await release(client, key, request_id)
+            reject()
+        
+        try:
+            yield
+        finally:
+            await release(client, key, request_id)
+    
+    return guard
@@ -1,7 +1,8 @@
 from typing import Dict, List, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
+import math
 import uuid
 
 class PositionStatus(str, Enum):
@@ -18,15 +19,22 @@ class ExitReason(str, Enum):
     RUG_RISK = "rug_risk"
     LOW_LIQUIDITY = "low_liquidity"
     AUTO_REBALANCE = "auto_rebalance"
+    
+    @classmethod
+    def from_value(cls, value: str, default: "ExitReason" = None) -> Optional["ExitReason"]:
+        """Look up a reason by its string value, returning default if unknown"""
+        return _EXIT_REASONS_BY_VALUE.get(value, default)
+
+_EXIT_REASONS_BY_VALUE = {reason.value: reason for reason in ExitReason}
 
 class Position(BaseModel):
-    id: str = None
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_wallet: str = "demo_wallet"  # For now, using demo
     pool_address: str
     pool_data: Dict
     entry_price: float
     entry_amount: float
-    entry_time: datetime
+    entry_time: datetime = Field(default_factory=datetime.now)
     entry_apy: float
     current_value: float = 0
     current_apy: float = 0
@@ -39,22 +47,31 @@ class Position(BaseModel):
     rewards_earned: float = 0
     gas_spent: float = 0
     
-    def __init__(self, **data):
-        if not data.get('id'):
-            data['id'] = str(uuid.uuid4())
-        if not data.get('entry_time'):
-            data['entry_time'] = datetime.now()
-        super().__init__(**data)
+    # Serialized form, reused by dict() until a field changes
+    _cached_dict: Optional[Dict] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name, value):
+        if not name.startswith('_'):
+            self._cached_dict = None
+        super().__setattr__(name, value)
+    
+    def dict(self, **kwargs) -> Dict:
+        """Serialize position; the default form is cached and must be treated as read-only"""
+        if kwargs:
+            return self.model_dump(**kwargs)
+        if self._cached_dict is None:
+            self._cached_dict = self.model_dump()
+        return self._cached_dict
     
     def calculate_current_value(self, current_price: float, hours_elapsed: float) -> float:
         """Calculate current value including APY rewards"""
         # Price appreciation/depreciation
         price_value = self.entry_amount * (current_price / self.entry_price)
         
-        # APY rewards (compound daily)
+        # APY rewards (compound daily); expm1/log1p keep precision for small rates and short holds
         daily_rate = self.current_apy / 365 / 100
         days_elapsed = hours_elapsed / 24
-        rewards_value = self.entry_amount * ((1 + daily_rate) ** days_elapsed - 1)
+        rewards_value = self.entry_amount * math.expm1(days_elapsed * math.log1p(daily_rate))
         
         self.current_value = price_value + rewards_value
         self.rewards_earned = rewards_value
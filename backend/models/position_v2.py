@@ -5,6 +5,29 @@ from decimal import Decimal
 from enum import Enum
 import uuid
 
+def _to_decimal(value: Any) -> Decimal:
+    """Decimal from a DB value; NUMERIC columns already arrive as Decimal, so skip the str round trip"""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+# to_dict converters, driven by the per-model field specs below
+def _same(value):
+    return value
+
+def _enum_value(value):
+    return value.value
+
+def _float(value):
+    return float(value)
+
+def _float_or_none(value):
+    return float(value) if value else None
+
+def _iso(value):
+    return value.isoformat()
+
+def _iso_or_none(value):
+    return value.isoformat() if value else None
+
 class PositionStatus(Enum):
     ACTIVE = "ACTIVE"
     CLOSED = "CLOSED"
@@ -15,7 +38,11 @@ class Protocol(Enum):
     ORCA = "orca"
     METEORA = "meteora"
 
-@dataclass
+# Value -> member maps for from_db_row, avoiding Enum's value lookup machinery per row
+_STATUS_BY_VALUE = {status.value: status for status in PositionStatus}
+_PROTOCOL_BY_VALUE = {protocol.value: protocol for protocol in Protocol}
+
+@dataclass(slots=True)
 class Position:
     """Core position model"""
     # Identity
@@ -68,27 +95,27 @@ class Position:
             id=str(row['id']),
             user_wallet=row['user_wallet'],
             pool_address=row['pool_address'],
-            protocol=Protocol(row['protocol']),
+            protocol=_PROTOCOL_BY_VALUE[row['protocol']],
             entry_timestamp=row['entry_timestamp'],
-            entry_price_a=Decimal(str(row['entry_price_a'])),
-            entry_price_b=Decimal(str(row['entry_price_b'])),
-            entry_amount_a=Decimal(str(row['entry_amount_a'])),
-            entry_amount_b=Decimal(str(row['entry_amount_b'])),
-            entry_lp_tokens=Decimal(str(row['entry_lp_tokens'])),
+            entry_price_a=_to_decimal(row['entry_price_a']),
+            entry_price_b=_to_decimal(row['entry_price_b']),
+            entry_amount_a=_to_decimal(row['entry_amount_a']),
+            entry_amount_b=_to_decimal(row['entry_amount_b']),
+            entry_lp_tokens=_to_decimal(row['entry_lp_tokens']),
             entry_tx_hash=row['entry_tx_hash'],
-            entry_value_usd=Decimal(str(row['entry_value_usd'])),
-            status=PositionStatus(row['status']),
-            current_amount_a=Decimal(str(row['current_amount_a'])) if row.get('current_amount_a') else None,
-            current_amount_b=Decimal(str(row['current_amount_b'])) if row.get('current_amount_b') else None,
-            fees_earned_a=Decimal(str(row.get('fees_earned_a', 0))),
-            fees_earned_b=Decimal(str(row.get('fees_earned_b', 0))),
+            entry_value_usd=_to_decimal(row['entry_value_usd']),
+            status=_STATUS_BY_VALUE[row['status']],
+            current_amount_a=_to_decimal(row['current_amount_a']) if row.get('current_amount_a') else None,
+            current_amount_b=_to_decimal(row['current_amount_b']) if row.get('current_amount_b') else None,
+            fees_earned_a=_to_decimal(row.get('fees_earned_a', 0)),
+            fees_earned_b=_to_decimal(row.get('fees_earned_b', 0)),
             exit_timestamp=row.get('exit_timestamp'),
-            exit_price_a=Decimal(str(row['exit_price_a'])) if row.get('exit_price_a') else None,
-            exit_price_b=Decimal(str(row['exit_price_b'])) if row.get('exit_price_b') else None,
-            exit_amount_a=Decimal(str(row['exit_amount_a'])) if row.get('exit_amount_a') else None,
-            exit_amount_b=Decimal(str(row['exit_amount_b'])) if row.get('exit_amount_b') else None,
+            exit_price_a=_to_decimal(row['exit_price_a']) if row.get('exit_price_a') else None,
+            exit_price_b=_to_decimal(row['exit_price_b']) if row.get('exit_price_b') else None,
+            exit_amount_a=_to_decimal(row['exit_amount_a']) if row.get('exit_amount_a') else None,
+            exit_amount_b=_to_decimal(row['exit_amount_b']) if row.get('exit_amount_b') else None,
             exit_tx_hash=row.get('exit_tx_hash'),
-            exit_value_usd=Decimal(str(row['exit_value_usd'])) if row.get('exit_value_usd') else None,
+            exit_value_usd=_to_decimal(row['exit_value_usd']) if row.get('exit_value_usd') else None,
             token_a_symbol=row['token_a_symbol'],
             token_b_symbol=row['token_b_symbol'],
             token_a_mint=row['token_a_mint'],
@@ -100,39 +127,7 @@ class Position:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'user_wallet': self.user_wallet,
-            'pool_address': self.pool_address,
-            'protocol': self.protocol.value,
-            'entry_timestamp': self.entry_timestamp.isoformat() if self.entry_timestamp else None,
-            'entry_price_a': float(self.entry_price_a),
-            'entry_price_b': float(self.entry_price_b),
-            'entry_amount_a': float(self.entry_amount_a),
-            'entry_amount_b': float(self.entry_amount_b),
-            'entry_lp_tokens': float(self.entry_lp_tokens),
-            'entry_tx_hash': self.entry_tx_hash,
-            'entry_value_usd': float(self.entry_value_usd),
-            'status': self.status.value,
-            'current_amount_a': float(self.current_amount_a) if self.current_amount_a else None,
-            'current_amount_b': float(self.current_amount_b) if self.current_amount_b else None,
-            'fees_earned_a': float(self.fees_earned_a),
-            'fees_earned_b': float(self.fees_earned_b),
-            'exit_timestamp': self.exit_timestamp.isoformat() if self.exit_timestamp else None,
-            'exit_price_a': float(self.exit_price_a) if self.exit_price_a else None,
-            'exit_price_b': float(self.exit_price_b) if self.exit_price_b else None,
-            'exit_amount_a': float(self.exit_amount_a) if self.exit_amount_a else None,
-            'exit_amount_b': float(self.exit_amount_b) if self.exit_amount_b else None,
-            'exit_tx_hash': self.exit_tx_hash,
-            'exit_value_usd': float(self.exit_value_usd) if self.exit_value_usd else None,
-            'token_a_symbol': self.token_a_symbol,
-            'token_b_symbol': self.token_b_symbol,
-            'token_a_mint': self.token_a_mint,
-            'token_b_mint': self.token_b_mint,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'last_sync': self.last_sync.isoformat() if self.last_sync else None
-        }
+        return {name: convert(getattr(self, name)) for name, convert in _POSITION_FIELDS}
     
     @property
     def pair_name(self) -> str:
@@ -145,29 +140,29 @@ class Position:
         return self.status == PositionStatus.ACTIVE
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSnapshot:
-    """Point-in-time snapshot of position metrics"""
+    """Point-in-time snapshot of position metrics (floats - analytics only, never settled)"""
     id: str
     position_id: str
     timestamp: datetime
     
     # Prices at snapshot
-    price_a: Decimal
-    price_b: Decimal
+    price_a: float
+    price_b: float
     
     # Calculated values
-    value_usd: Decimal
-    fees_earned_usd: Decimal
-    impermanent_loss_usd: Decimal
-    impermanent_loss_percent: Decimal
-    net_pnl_usd: Decimal
-    net_pnl_percent: Decimal
+    value_usd: float
+    fees_earned_usd: float
+    impermanent_loss_usd: float
+    impermanent_loss_percent: float
+    net_pnl_usd: float
+    net_pnl_percent: float
     
     # Pool metrics
-    pool_tvl: Optional[Decimal] = None
-    pool_apy: Optional[Decimal] = None
-    pool_volume_24h: Optional[Decimal] = None
+    pool_tvl: Optional[float] = None
+    pool_apy: Optional[float] = None
+    pool_volume_24h: Optional[float] = None
     
     created_at: Optional[datetime] = None
     
@@ -178,36 +173,74 @@ class PositionSnapshot:
             id=str(row['id']),
             position_id=str(row['position_id']),
             timestamp=row['timestamp'],
-            price_a=Decimal(str(row['price_a'])),
-            price_b=Decimal(str(row['price_b'])),
-            value_usd=Decimal(str(row['value_usd'])),
-            fees_earned_usd=Decimal(str(row['fees_earned_usd'])),
-            impermanent_loss_usd=Decimal(str(row['impermanent_loss_usd'])),
-            impermanent_loss_percent=Decimal(str(row['impermanent_loss_percent'])),
-            net_pnl_usd=Decimal(str(row['net_pnl_usd'])),
-            net_pnl_percent=Decimal(str(row['net_pnl_percent'])),
-            pool_tvl=Decimal(str(row['pool_tvl'])) if row.get('pool_tvl') else None,
-            pool_apy=Decimal(str(row['pool_apy'])) if row.get('pool_apy') else None,
-            pool_volume_24h=Decimal(str(row['pool_volume_24h'])) if row.get('pool_volume_24h') else None,
+            price_a=float(row['price_a']),
+            price_b=float(row['price_b']),
+            value_usd=float(row['value_usd']),
+            fees_earned_usd=float(row['fees_earned_usd']),
+            impermanent_loss_usd=float(row['impermanent_loss_usd']),
+            impermanent_loss_percent=float(row['impermanent_loss_percent']),
+            net_pnl_usd=float(row['net_pnl_usd']),
+            net_pnl_percent=float(row['net_pnl_percent']),
+            pool_tvl=float(row['pool_tvl']) if row.get('pool_tvl') else None,
+            pool_apy=float(row['pool_apy']) if row.get('pool_apy') else None,
+            pool_volume_24h=float(row['pool_volume_24h']) if row.get('pool_volume_24h') else None,
             created_at=row.get('created_at')
         )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'position_id': self.position_id,
-            'timestamp': self.timestamp.isoformat(),
-            'price_a': float(self.price_a),
-            'price_b': float(self.price_b),
-            'value_usd': float(self.value_usd),
-            'fees_earned_usd': float(self.fees_earned_usd),
-            'impermanent_loss_usd': float(self.impermanent_loss_usd),
-            'impermanent_loss_percent': float(self.impermanent_loss_percent),
-            'net_pnl_usd': float(self.net_pnl_usd),
-            'net_pnl_percent': float(self.net_pnl_percent),
-            'pool_tvl': float(self.pool_tvl) if self.pool_tvl else None,
-            'pool_apy': float(self.pool_apy) if self.pool_apy else None,
-            'pool_volume_24h': float(self.pool_volume_24h) if self.pool_volume_24h else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+        return {name: convert(getattr(self, name)) for name, convert in _SNAPSHOT_FIELDS}
+
+
+# (field, converter) pairs in to_dict output order
+_POSITION_FIELDS = (
+    ('id', _same),
+    ('user_wallet', _same),
+    ('pool_address', _same),
+    ('protocol', _enum_value),
+    ('entry_timestamp', _iso_or_none),
+    ('entry_price_a', _float),
+    ('entry_price_b', _float),
+    ('entry_amount_a', _float),
+    ('entry_amount_b', _float),
+    ('entry_lp_tokens', _float),
+    ('entry_tx_hash', _same),
+    ('entry_value_usd', _float),
+    ('status', _enum_value),
+    ('current_amount_a', _float_or_none),
+    ('current_amount_b', _float_or_none),
+    ('fees_earned_a', _float),
+    ('fees_earned_b', _float),
+    ('exit_timestamp', _iso_or_none),
+    ('exit_price_a', _float_or_none),
+    ('exit_price_b', _float_or_none),
+    ('exit_amount_a', _float_or_none),
+    ('exit_amount_b', _float_or_none),
+    ('exit_tx_hash', _same),
+    ('exit_value_usd', _float_or_none),
+    ('token_a_symbol', _same),
+    ('token_b_symbol', _same),
+    ('token_a_mint', _same),
+    ('token_b_mint', _same),
+    ('created_at', _iso_or_none),
+    ('updated_at', _iso_or_none),
+    ('last_sync', _iso_or_none),
+)
+
+_SNAPSHOT_FIELDS = (
+    ('id', _same),
+    ('position_id', _same),
+    ('timestamp', _iso),
+    ('price_a', _float),
+    ('price_b', _float),
+    ('value_usd', _float),
+    ('fees_earned_usd', _float),
+    ('impermanent_loss_usd', _float),
+    ('impermanent_loss_percent', _float),
+    ('net_pnl_usd', _float),
+    ('net_pnl_percent', _float),
+    ('pool_tvl', _float_or_none),
+    ('pool_apy', _float_or_none),
+    ('pool_volume_24h', _float_or_none),
+    ('created_at', _iso_or_none),
+)
@@ -3,10 +3,11 @@ Trading Strategy Models
 Defines the structure for automated trading strategies
 """
 
-from dataclasses import dataclass
-from typing import Dict, Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, List, Tuple
 from enum import Enum
 from datetime import timedelta
+from types import MappingProxyType
 
 class StrategyType(Enum):
     CONSERVATIVE = "conservative"
@@ -24,7 +25,7 @@ class ExitReason(Enum):
     MANUAL_EXIT = "manual_exit"
     RUG_DETECTION = "rug_detection"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EntryRules:
     """Rules for entering a position"""
     max_risk_score: int = 60
@@ -36,12 +37,17 @@ class EntryRules:
     max_volume_to_tvl_ratio: float = 5.0  # Avoid wash trading
     min_sustainability_score: float = 3.0
     max_il_risk: int = 70
-    allowed_protocols: List[str] = None
-    blocked_tokens: List[str] = None  # Known scam tokens
+    allowed_protocols: FrozenSet[str] = frozenset()
+    blocked_tokens: FrozenSet[str] = frozenset()  # Known scam tokens
     require_liquidity_lock: bool = False
     min_pool_age_hours: int = 24
+    
+    def __post_init__(self):
+        # Accept any iterable; store frozensets so membership checks are O(1)
+        object.__setattr__(self, "allowed_protocols", frozenset(self.allowed_protocols))
+        object.__setattr__(self, "blocked_tokens", frozenset(self.blocked_tokens))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExitRules:
     """Rules for exiting a position"""
     stop_loss_percent: float = -10.0
@@ -55,7 +61,7 @@ class ExitRules:
     rug_pull_volume_drop_percent: float = -70.0
     check_interval_minutes: int = 5
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PositionSizing:
     """Rules for position sizing"""
     sizing_method: str = "fixed"  # fixed, risk_based, kelly, portfolio_percent
@@ -67,7 +73,7 @@ class PositionSizing:
     min_position_size_usd: float = 50.0
     gas_cost_limit_percent: float = 0.02  # Max 2% gas cost
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskLimits:
     """Portfolio-wide risk limits"""
     max_total_positions: int = 10
@@ -80,7 +86,7 @@ class RiskLimits:
     max_correlation_coefficient: float = 0.7
     rebalance_threshold_percent: float = 0.15  # Rebalance if position > 15%
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradingStrategy:
     """Complete trading strategy configuration"""
     name: str
@@ -91,9 +97,14 @@ class TradingStrategy:
     risk_limits: RiskLimits
     enabled: bool = True
     description: str = ""
+    # Result of validate(), computed once - the strategy is frozen so it can't change
+    _valid: bool = field(init=False, repr=False, compare=False)
     
-    def validate(self) -> bool:
-        """Validate strategy parameters"""
+    def __post_init__(self):
+        object.__setattr__(self, "_valid", self._check())
+    
+    def _check(self) -> bool:
+        """Check strategy parameters"""
         if self.entry_rules.min_apy >= self.entry_rules.max_apy:
             return False
         if self.exit_rules.stop_loss_percent >= 0:
@@ -103,6 +114,10 @@ class TradingStrategy:
         if self.position_sizing.max_portfolio_percent > 1.0:
             return False
         return True
+    
+    def validate(self) -> bool:
+        """Validate strategy parameters"""
+        return self._valid
 
 # Preset Strategies
 CONSERVATIVE_STRATEGY = TradingStrategy(
@@ -218,9 +233,14 @@ DEGEN_STRATEGY = TradingStrategy(
     description="High risk, high reward strategy for experienced degens"
 )
 
-# Strategy registry
-STRATEGY_PRESETS = {
+# Strategy registry (read-only; presets are frozen and shared by every bot)
+STRATEGY_PRESETS = MappingProxyType({
     StrategyType.CONSERVATIVE: CONSERVATIVE_STRATEGY,
     StrategyType.BALANCED: BALANCED_STRATEGY,
     StrategyType.DEGEN: DEGEN_STRATEGY
-}
\ No newline at end of file
+})
+
+# Fail at import rather than on the first trade if a preset is misconfigured
+for _preset in STRATEGY_PRESETS.values():
+    if not _preset.validate():
+        raise ValueError(f"Invalid strategy preset: {_preset.name}")
\ No newline at end of file
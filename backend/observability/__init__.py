@@ -48,33 +48,34 @@ __all__ = [
     'TransactionLogger'
 ]
 
-# Production observability checklist
-OBSERVABILITY_CHECKLIST = {
-    "metrics": {
-        "rpc_latency": "Track p50, p95, p99 latencies",
-        "rpc_errors": "Count by error type and endpoint",
-        "websocket_health": "Active connections and reconnects",
-        "agent_performance": "Decision latency and success rate",
-        "pnl_accuracy": "Track calculation accuracy vs actual"
-    },
-    "logging": {
-        "structured": "JSON format with trace IDs",
-        "correlated": "Link related events with trace IDs",
-        "searchable": "Index by trace_id, agent, timestamp",
-        "retention": "30 days for debugging, 90 days for compliance"
-    },
-    "monitoring": {
-        "health_checks": "/health endpoint for all services",
-        "dashboards": "Grafana dashboards for key metrics",
-        "alerts": "PagerDuty for critical issues",
-        "slos": "99.9% uptime, <500ms p95 latency"
-    },
-    "tracing": {
-        "distributed": "Trace across agent boundaries",
-        "sampling": "100% for errors, 10% for success",
-        "visualization": "Jaeger or similar for trace analysis"
+def get_checklist():
+    """Production observability checklist (built on request; nothing at runtime needs it)"""
+    return {
+        "metrics": {
+            "rpc_latency": "Track p50, p95, p99 latencies",
+            "rpc_errors": "Count by error type and endpoint",
+            "websocket_health": "Active connections and reconnects",
+            "agent_performance": "Decision latency and success rate",
+            "pnl_accuracy": "Track calculation accuracy vs actual"
+        },
+        "logging": {
+            "structured": "JSON format with trace IDs",
+            "correlated": "Link related events with trace IDs",
+            "searchable": "Index by trace_id, agent, timestamp",
+            "retention": "30 days for debugging, 90 days for compliance"
+        },
+        "monitoring": {
+            "health_checks": "/health endpoint for all services",
+            "dashboards": "Grafana dashboards for key metrics",
+            "alerts": "PagerDuty for critical issues",
+            "slos": "99.9% uptime, <500ms p95 latency"
+        },
+        "tracing": {
+            "distributed": "Trace across agent boundaries",
+            "sampling": "100% for errors, 10% for success",
+            "visualization": "Jaeger or similar for trace analysis"
+        }
     }
-}
 
 def initialize_observability():
     """Initialize all observability components"""
@@ -2,11 +2,18 @@
 Production Logging Configuration
 Structured logging with trace IDs and correlation
 """
+import atexit
+import itertools
 import logging
 import logging.config
-import json
+import logging.handlers
+import orjson
+import os
+import queue
 import sys
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import uuid
 from contextvars import ContextVar
@@ -15,6 +22,41 @@ from pythonjsonlogger import jsonlogger
 # Context variable for trace IDs
 trace_id_var: ContextVar[Optional[str]] = ContextVar('trace_id', default=None)
 
+# Auto trace IDs are a per-process random prefix plus a counter - no urandom read per log record.
+# They only label otherwise-uncorrelated records; IDs that are stored or correlated use uuid4.
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_id_counter = itertools.count()
+
+def _next_id() -> str:
+    """Process-unique ID: 8 hex chars of prefix followed by 8+ of counter"""
+    return f"{_ID_PREFIX}{next(_id_counter):08x}"
+
+# Service metadata, shared by every log record (never mutated)
+_SERVICE_INFO = {
+    'name': 'solana-yield-hunter',
+    'environment': 'production',
+    'version': '1.0.0'
+}
+
+# LogRecord attributes that aren't user-supplied extras
+_RESERVED_LOG_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename',
+    'funcName', 'levelname', 'levelno', 'lineno',
+    'module', 'msecs', 'pathname', 'process',
+    'processName', 'relativeCreated', 'thread',
+    'threadName', 'exc_info', 'exc_text', 'stack_info',
+    'getMessage', 'trace_id', 'message', 'asctime'
+})
+
+@lru_cache(maxsize=1024)
+def _source_info(filename: str, line: int, function: str) -> Dict[str, Any]:
+    """Source location block, shared by records logged from the same call site (never mutated)"""
+    return {
+        'file': filename,
+        'line': line,
+        'function': function
+    }
+
 class TraceIDFilter(logging.Filter):
     """Add trace ID to log records"""
     
@@ -24,7 +66,7 @@ class TraceIDFilter(logging.Filter):
             record.trace_id = trace_id
         else:
             # Generate new trace ID if none exists
-            record.trace_id = f"auto_{uuid.uuid4().hex[:16]}"
+            record.trace_id = f"auto_{_next_id()}"
         return True
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
@@ -33,42 +75,37 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
     def add_fields(self, log_record, record, message_dict):
         super(CustomJsonFormatter, self).add_fields(log_record, record, message_dict)
         
-        # Add timestamp
-        log_record['timestamp'] = datetime.utcnow().isoformat()
+        # Add timestamp (serialized by orjson in jsonify_log_record)
+        log_record['timestamp'] = datetime.utcnow()
         
         # Add log level
         log_record['level'] = record.levelname
         
         # Add source location
-        log_record['source'] = {
-            'file': record.filename,
-            'line': record.lineno,
-            'function': record.funcName
-        }
+        log_record['source'] = _source_info(record.filename, record.lineno, record.funcName)
         
         # Add service metadata
-        log_record['service'] = {
-            'name': 'solana-yield-hunter',
-            'environment': 'production',
-            'version': '1.0.0'
-        }
+        log_record['service'] = _SERVICE_INFO
         
         # Move trace_id to top level if it exists
         if hasattr(record, 'trace_id'):
             log_record['trace_id'] = record.trace_id
         
         # Add any extra fields from the record
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename', 
-                          'funcName', 'levelname', 'levelno', 'lineno', 
-                          'module', 'msecs', 'pathname', 'process', 
-                          'processName', 'relativeCreated', 'thread', 
-                          'threadName', 'exc_info', 'exc_text', 'stack_info',
-                          'getMessage', 'trace_id']:
-                # Add to extra fields
-                if 'extra' not in log_record:
-                    log_record['extra'] = {}
-                log_record['extra'][key] = value
+        extra = {
+            key: value for key, value in record.__dict__.items()
+            if key not in _RESERVED_LOG_ATTRS
+        }
+        if extra:
+            log_record['extra'] = extra
+    
+    def jsonify_log_record(self, log_record):
+        """Serialize with orjson instead of the stdlib json module"""
+        return orjson.dumps(
+            log_record,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        ).decode()
 
 class AgentLogger:
     """Specialized logger for agent decisions"""
@@ -172,47 +209,101 @@ class TransactionLogger:
             }
         )
 
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for a same-process listener: enqueues records untouched"""
+    
+    def prepare(self, record):
+        # The base class formats the message and drops exc_info so records can be pickled;
+        # our queue never leaves the process, so leave that work to the listener thread
+        return record
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that buffers writes instead of flushing every record
+    
+    The buffer is flushed every flush_interval seconds, on ERROR and above,
+    on rollover and on close.
+    """
+    
+    def __init__(self, *args, buffer_size: int = 1 << 16, flush_interval: float = 0.25, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._size = 0  # Bytes in the current file, tracked here since tell() would flush the buffer
+        super().__init__(*args, **kwargs)
+        
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+        self._flusher.start()
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # Same size check as RotatingFileHandler.shouldRollover, minus its seek()/tell()
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes and os.path.isfile(self.baseFilename):
+                self.doRollover()  # Closing the old file flushes its buffer
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self):
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        self._closing.set()
+        super().close()
+
+# Background thread draining the log queue into the output handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_queue_listener():
+    """Flush queued records and stop the listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
-    """Setup production logging configuration"""
+    """Setup production logging configuration
     
-    # Create formatters
-    json_formatter = CustomJsonFormatter()
+    Loggers only put records on a queue; JSON formatting and writes happen on a
+    QueueListener thread so logging calls don't block on I/O.
+    """
+    global _queue_listener
     
-    # Create filters
-    trace_filter = TraceIDFilter()
+    # Drain and stop the listener from any previous setup
+    _stop_queue_listener()
+    log_queue = queue.Queue(-1)
     
-    # Handler configuration
+    # Handler configuration - trace IDs live in a context variable, so stamp them before enqueueing
     handlers = {
-        'console': {
-            'class': 'logging.StreamHandler',
-            'level': log_level,
-            'formatter': 'json',
-            'filters': ['trace_id'],
-            'stream': sys.stdout
+        'queue': {
+            '()': InProcessQueueHandler,
+            'queue': log_queue,
+            'filters': ['trace_id']
         }
     }
     
-    # Add file handler if specified
-    if log_file:
-        handlers['file'] = {
-            'class': 'logging.handlers.RotatingFileHandler',
-            'level': log_level,
-            'formatter': 'json',
-            'filters': ['trace_id'],
-            'filename': log_file,
-            'maxBytes': 100 * 1024 * 1024,  # 100MB
-            'backupCount': 10
-        }
-    
     # Logging configuration
     config = {
         'version': 1,
         'disable_existing_loggers': False,
-        'formatters': {
-            'json': {
-                '()': CustomJsonFormatter
-            }
-        },
         'filters': {
             'trace_id': {
                 '()': TraceIDFilter
@@ -221,22 +312,22 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
         'handlers': handlers,
         'loggers': {
             '': {  # Root logger
-                'handlers': list(handlers.keys()),
+                'handlers': ['queue'],
                 'level': log_level,
                 'propagate': False
             },
             'agent': {
-                'handlers': list(handlers.keys()),
+                'handlers': ['queue'],
                 'level': 'DEBUG',
                 'propagate': False
             },
             'blockchain': {
-                'handlers': list(handlers.keys()),
+                'handlers': ['queue'],
                 'level': 'INFO',
                 'propagate': False
             },
             'observability': {
-                'handlers': list(handlers.keys()),
+                'handlers': ['queue'],
                 'level': 'INFO',
                 'propagate': False
             }
@@ -246,13 +337,39 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     # Apply configuration
     logging.config.dictConfig(config)
     
+    # Create formatters
+    json_formatter = CustomJsonFormatter()
+    
+    # Output handlers, written from the listener thread
+    # (created after dictConfig, which closes every existing handler)
+    output_handlers = {
+        'console': logging.StreamHandler(sys.stdout)
+    }
+    
+    # Add file handler if specified
+    if log_file:
+        output_handlers['file'] = BufferedRotatingFileHandler(
+            log_file,
+            maxBytes=100 * 1024 * 1024,  # 100MB
+            backupCount=10
+        )
+    
+    for handler in output_handlers.values():
+        handler.setLevel(log_level)
+        handler.setFormatter(json_formatter)
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *output_handlers.values(), respect_handler_level=True
+    )
+    _queue_listener.start()
+    
     # Log startup
     logger = logging.getLogger('observability.logging')
     logger.info(
         "Logging system initialized",
         extra={
             'log_level': log_level,
-            'handlers': list(handlers.keys()),
+            'handlers': list(output_handlers.keys()),
             'log_file': log_file
         }
     )
@@ -9,12 +9,19 @@ from functools import wraps
 from datetime import datetime
 from contextlib import contextmanager
 import asyncio
+import itertools
+import uuid
 from collections import defaultdict
 from prometheus_client import Counter, Histogram, Gauge, Summary
-import json
+import orjson
+from observability.logging_config import _RESERVED_LOG_ATTRS
 
 logger = logging.getLogger(__name__)
 
+# Operation trace IDs: per-process random prefix plus a counter, unique even within a millisecond
+_OPERATION_ID_PREFIX = uuid.uuid4().hex[:8]
+_operation_counter = itertools.count()
+
 # Prometheus metrics
 rpc_latency_histogram = Histogram(
     'solana_rpc_latency_seconds',
@@ -258,7 +265,7 @@ def track_async_operation(operation_type: str):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             start_time = time.time()
-            trace_id = kwargs.get('trace_id', f"{operation_type}_{int(time.time() * 1000)}")
+            trace_id = kwargs.get('trace_id') or f"{operation_type}_{_OPERATION_ID_PREFIX}{next(_operation_counter):08x}"
             
             try:
                 result = await func(*args, **kwargs)
@@ -310,7 +317,7 @@ class StructuredLogger:
         class JSONFormatter(logging.Formatter):
             def format(self, record):
                 log_obj = {
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': datetime.utcnow(),
                     'level': record.levelname,
                     'logger': record.name,
                     'message': record.getMessage(),
@@ -319,14 +326,14 @@ class StructuredLogger:
                 
                 # Add extra fields
                 for key, value in record.__dict__.items():
-                    if key not in ['name', 'msg', 'args', 'created', 'filename', 
-                                  'funcName', 'levelname', 'levelno', 'lineno', 
-                                  'module', 'msecs', 'pathname', 'process', 
-                                  'processName', 'relativeCreated', 'thread', 
-                                  'threadName', 'getMessage']:
+                    if key not in _RESERVED_LOG_ATTRS:
                         log_obj[key] = value
                 
-                return json.dumps(log_obj)
+                return orjson.dumps(
+                    log_obj,
+                    default=str,
+                    option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+                ).decode()
         
         return JSONFormatter()
     
@@ -14,4 +14,4 @@ if __name__ == "__main__":
     from main import app
     
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="uvloop", http="httptools")
\ No newline at end of file
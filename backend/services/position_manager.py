@@ -1,9 +1,9 @@
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import json
-import requests
 from models.position import Position, PositionStatus, ExitReason, PositionSummary
 from .wallet_service import get_wallet, TransactionType
+from utils.http_client import http_client
 
 class PositionManager:
     """Manages all user positions (simulated for now)"""
@@ -13,6 +13,15 @@ class PositionManager:
         self.positions: Dict[str, Position] = {}
         self.position_history: List[Position] = []
         
+        # Index of positions entered and not yet exited, so lookups don't scan all positions ever
+        self._active: Dict[str, Position] = {}
+        
+        # Running total of gas across all positions
+        self.total_gas_spent: float = 0.0
+        
+        # Bumped on every position mutation; backs the /positions ETag
+        self.version: int = 0
+        
         # Get wallet instance
         self.wallet = get_wallet()
         
@@ -23,7 +32,7 @@ class PositionManager:
         
     def can_enter_position(self, amount: float) -> Tuple[bool, str]:
         """Check if we can enter a new position"""
-        active_positions = [p for p in self.positions.values() if p.status == PositionStatus.ACTIVE]
+        active_positions = self.get_active_positions()
         
         # Check wallet balance
         wallet_balance = self.wallet.get_available_balance()
@@ -76,6 +85,9 @@ class PositionManager:
         self.wallet.pay_fee(0.01, f"Gas fee for entering {pool_name}")
         
         self.positions[position.id] = position
+        self._active[position.id] = position
+        self.total_gas_spent += position.gas_spent
+        self.version += 1
         
         print(f"[PositionManager] Entered position {position.id} in {pool_name} with ${amount}")
         
@@ -109,6 +121,7 @@ class PositionManager:
         # Calculate current value
         position.current_value = position.entry_amount * earned_multiplier * price_multiplier
         position.calculate_current_value(price_multiplier, hours_elapsed)
+        self.version += 1
         
         # Check exit conditions
         should_exit, exit_reason = position.should_exit(current_metrics)
@@ -133,6 +146,7 @@ class PositionManager:
         position.exit_price = 1.0  # Simulated
         position.exit_reason = reason
         position.gas_spent += 0.01  # Exit gas
+        self.total_gas_spent += 0.01
         
         # Final P&L calculation
         hours_elapsed = (position.exit_time - position.entry_time).total_seconds() / 3600
@@ -151,7 +165,9 @@ class PositionManager:
         self.wallet.pay_fee(0.01, f"Gas fee for exiting {pool_name}")
         
         # Move to history
+        self._active.pop(position.id, None)
         self.position_history.append(position)
+        self.version += 1
         
         print(f"[PositionManager] Exited position {position.id} - Reason: {reason}, P&L: ${position.pnl_amount:.2f} ({position.pnl_percent:.1f}%)")
         
@@ -159,7 +175,15 @@ class PositionManager:
     
     def get_active_positions(self) -> List[Position]:
         """Get all active positions"""
-        return [p for p in self.positions.values() if p.status == PositionStatus.ACTIVE]
+        return [p for p in self._active.values() if p.status == PositionStatus.ACTIVE]
+    
+    def reset(self):
+        """Drop all positions and history"""
+        self.positions.clear()
+        self.position_history.clear()
+        self._active.clear()
+        self.total_gas_spent = 0.0
+        self.version += 1
     
     def get_position_summary(self) -> PositionSummary:
         """Get summary of all positions"""
@@ -206,52 +230,72 @@ class PositionManager:
     
     def _fetch_real_pool_metrics(self, pool_address: str) -> Dict[str, Any]:
         """Fetch real-time pool metrics from Raydium"""
+        return self.fetch_pool_metrics_batch([pool_address]).get(pool_address, {})
+    
+    def fetch_pool_metrics_batch(self, pool_addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch real-time metrics for many pools with a single Raydium request"""
+        # Skip UUIDs (DeFiLlama pools)
+        wanted = {
+            address for address in pool_addresses
+            if not ("-" in address and len(address) == 36)
+        }
+        if not wanted:
+            return {}
+        
+        metrics = {}
         try:
-            # Skip if it's a UUID (DeFiLlama pools)
-            if "-" in pool_address and len(pool_address) == 36:
-                return {}
-            
-            response = requests.get("https://api.raydium.io/v2/main/pairs", timeout=5)
+            response = http_client.get("https://api.raydium.io/v2/main/pairs", timeout=5)
             if response.status_code == 200:
-                pools = response.json()
-                
-                for pool in pools:
-                    if pool.get("ammId") == pool_address:
-                        # Calculate current APY
-                        liquidity = float(pool.get("liquidity", 0))
-                        volume_24h = float(pool.get("volume24h", 0))
-                        
-                        if liquidity > 0:
-                            daily_fees = volume_24h * 0.0025
-                            daily_yield = (daily_fees / liquidity) * 100
-                            current_apy = daily_yield * 365
-                        else:
-                            current_apy = 0
-                        
-                        # Calculate price change (simplified - comparing to 24h ago)
-                        price = float(pool.get("price", 1.0))
-                        price_24h_ago = float(pool.get("price24h", price))
-                        price_change = price / price_24h_ago if price_24h_ago > 0 else 1.0
-                        
-                        return {
-                            "apy": current_apy,
-                            "tvl": liquidity,
-                            "volume_24h": volume_24h,
-                            "price": price,
-                            "price_change": price_change,
-                            "rug_risk": liquidity < 10000  # Simple risk check
-                        }
-                        
-            return {}
+                for pool in response.json():
+                    address = pool.get("ammId")
+                    if address in wanted:
+                        metrics[address] = self._pool_metrics(pool)
+                        if len(metrics) == len(wanted):
+                            break
         except Exception as e:
             print(f"[PositionManager] Error fetching pool metrics: {e}")
-            return {}
+        
+        return metrics
+    
+    @staticmethod
+    def _pool_metrics(pool: Dict) -> Dict[str, Any]:
+        """Derive position metrics from a Raydium pair entry"""
+        # Calculate current APY
+        liquidity = float(pool.get("liquidity", 0))
+        volume_24h = float(pool.get("volume24h", 0))
+        
+        if liquidity > 0:
+            daily_fees = volume_24h * 0.0025
+            daily_yield = (daily_fees / liquidity) * 100
+            current_apy = daily_yield * 365
+        else:
+            current_apy = 0
+        
+        # Calculate price change (simplified - comparing to 24h ago)
+        price = float(pool.get("price", 1.0))
+        price_24h_ago = float(pool.get("price24h", price))
+        price_change = price / price_24h_ago if price_24h_ago > 0 else 1.0
+        
+        return {
+            "apy": current_apy,
+            "tvl": liquidity,
+            "volume_24h": volume_24h,
+            "price": price,
+            "price_change": price_change,
+            "rug_risk": liquidity < 10000  # Simple risk check
+        }
+    
+    def update_all_positions(self) -> Dict[str, Dict[str, Any]]:
+        """Update all active positions with real data, returning the fetched metrics by pool address"""
+        metrics = self.fetch_pool_metrics_batch([position.pool_address for position in self.get_active_positions()])
+        self.apply_pool_metrics(metrics)
+        return metrics
     
-    def update_all_positions(self):
-        """Update all active positions with real data"""
+    def apply_pool_metrics(self, metrics: Dict[str, Dict[str, Any]]):
+        """Update all active positions from already-fetched metrics (no I/O)"""
         for position in self.get_active_positions():
             try:
-                self.update_position(position.id)
+                self.update_position(position.id, metrics.get(position.pool_address, {}))
                 print(f"[PositionManager] Updated position {position.id} - Current value: ${position.current_value:.2f}")
             except Exception as e:
                 print(f"[PositionManager] Error updating position {position.id}: {e}")
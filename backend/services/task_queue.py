@@ -0,0 +1,79 @@
+"""
+Background Task Queue
+Runs long agent workflows (hunts) outside the HTTP request cycle
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+class TaskQueue:
+    def __init__(self, workers: int = 2, max_pending: int = 100):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks = []
+        self._running: Set[str] = set()  # Task ids of jobs a worker is executing
+
+    async def start(self):
+        """Start worker tasks"""
+        if self._worker_tasks:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(i)) for i in range(self.workers)
+        ]
+        logger.info(f"Task queue started with {self.workers} workers")
+
+    async def stop(self) -> List[str]:
+        """Cancel workers; queued jobs are dropped. Returns the ids of cancelled and dropped jobs"""
+        abandoned = list(self._running)
+        if self._queue is not None:
+            while not self._queue.empty():
+                task_id, _ = self._queue.get_nowait()
+                abandoned.append(task_id)
+
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info("Task queue stopped")
+        return abandoned
+
+    def submit(self, task_id: str, job: Job) -> bool:
+        """Queue a job; returns False if the queue is not running or full"""
+        if self._queue is None:
+            return False
+
+        try:
+            self._queue.put_nowait((task_id, job))
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._queue.qsize() if self._queue else 0
+
+    async def _worker(self, worker_id: int):
+        """Pull jobs off the queue until cancelled"""
+        while True:
+            item: Tuple[str, Job] = await self._queue.get()
+            task_id, job = item
+            self._running.add(task_id)
+            try:
+                await job()
+            except Exception as e:
+                logger.error(f"Task {task_id} failed on worker {worker_id}: {e}")
+            finally:
+                self._running.discard(task_id)
+                self._queue.task_done()
+
+# Global instance
+task_queue = TaskQueue()
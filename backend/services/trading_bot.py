@@ -13,7 +13,7 @@ from models.trading_strategy import (
     TradingStrategy, StrategyType, ExitReason,
     STRATEGY_PRESETS
 )
-from models.position import Position, PositionStatus
+from models.position import Position, ExitReason as PositionExitReason
 from services.position_manager import position_manager
 from services.risk_analysis_service import risk_analysis_service
 from database.connection import get_db_connection
@@ -155,10 +155,11 @@ class TradingBot:
         """Execute position exit"""
         logger.info(f"Exiting position {position.id} due to {reason.value}")
         
-        # Update position status
-        position.status = PositionStatus.CLOSED
-        position.exit_time = datetime.now()
-        position.exit_reason = reason
+        # Close through the position manager so the wallet, active totals and version stay in step
+        position_manager.exit_position(
+            position.id,
+            PositionExitReason.from_value(reason.value, PositionExitReason.MANUAL)
+        )
         
         # Track performance
         self.performance_tracker['total_trades'] += 1
@@ -1,9 +1,11 @@
 """Mock wallet service for testing position management and tracking performance."""
 
+from bisect import bisect_left
 from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
+import itertools
 import json
 import os
 from uuid import uuid4
@@ -19,7 +21,7 @@ class TransactionType(Enum):
     REWARD = "reward"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Represents a wallet transaction."""
     id: str
@@ -45,7 +47,7 @@ class Transaction:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Wallet performance metrics."""
     total_pnl: float = 0.0
@@ -82,8 +84,14 @@ class MockWalletService:
         """Initialize wallet with starting balance."""
         self.initial_balance = initial_balance
         self.balance = initial_balance
+        self.all_time_high = initial_balance  # Highest balance seen, updated per transaction
         self.transactions: List[Transaction] = []
+        self._tx_index: Dict[str, int] = {}  # Transaction id -> index in self.transactions
+        self._position_tx: Dict[str, List[int]] = {}  # Position id -> transaction indices
         self.position_pnl: Dict[str, float] = {}  # Track P&L per position
+        self._metrics_cache: Optional[PerformanceMetrics] = None  # Cleared on every transaction
+        self._total_fees = 0.0  # Running sum of fee transaction amounts
+        self.version = 0  # Set from _wallet_versions on every transaction; backs the /wallet ETag
         
         # Add initial deposit transaction
         self._add_transaction(
@@ -111,7 +119,17 @@ class MockWalletService:
             description=description,
             metadata=metadata or {}
         )
+        index = len(self.transactions)
         self.transactions.append(transaction)
+        self._tx_index[transaction.id] = index
+        if position_id:
+            self._position_tx.setdefault(position_id, []).append(index)
+        if transaction_type == TransactionType.FEE:
+            self._total_fees += amount
+        if self.balance > self.all_time_high:
+            self.all_time_high = self.balance
+        self._metrics_cache = None
+        self.version = next(_wallet_versions)
         return transaction
     
     def get_balance(self) -> float:
@@ -136,7 +154,10 @@ class MockWalletService:
         # Deduct amount from balance
         self.balance -= amount
         
-        # Record transaction
+        # Initialize P&L tracking for this position
+        self.position_pnl[position_id] = 0.0
+        
+        # Record transaction (last, so the version bump covers every change above)
         self._add_transaction(
             TransactionType.POSITION_ENTRY,
             -amount,
@@ -145,9 +166,6 @@ class MockWalletService:
             metadata={"pool_name": pool_name, "apy": apy}
         )
         
-        # Initialize P&L tracking for this position
-        self.position_pnl[position_id] = 0.0
-        
         return True
     
     def exit_position(
@@ -162,7 +180,11 @@ class MockWalletService:
         total_return = amount + pnl
         self.balance += total_return
         
-        # Record transaction
+        # Update position P&L tracking
+        if position_id in self.position_pnl:
+            self.position_pnl[position_id] = pnl
+        
+        # Record transaction (last, so the version bump covers every change above)
         self._add_transaction(
             TransactionType.POSITION_EXIT,
             total_return,
@@ -171,10 +193,6 @@ class MockWalletService:
             metadata={"pool_name": pool_name, "pnl": pnl, "original_amount": amount}
         )
         
-        # Update position P&L tracking
-        if position_id in self.position_pnl:
-            self.position_pnl[position_id] = pnl
-        
         return True
     
     def pay_fee(self, amount: float, description: str = "Transaction fee") -> bool:
@@ -203,21 +221,35 @@ class MockWalletService:
         self,
         limit: int = 50,
         offset: int = 0,
-        position_id: Optional[str] = None
+        position_id: Optional[str] = None,
+        after: Optional[str] = None
     ) -> List[Transaction]:
-        """Get transaction history."""
-        transactions = self.transactions
+        """Get transaction history, newest first.
         
+        Pass the id of the last transaction of a page as `after` to get the next page.
+        Transactions are appended in time order, so a page is a reversed slice - O(limit).
+        """
         if position_id:
-            transactions = [t for t in transactions if t.position_id == position_id]
+            indices = self._position_tx.get(position_id, [])
+        else:
+            indices = range(len(self.transactions))
         
-        # Sort by timestamp descending (newest first)
-        transactions = sorted(transactions, key=lambda t: t.timestamp, reverse=True)
+        # Exclusive upper bound (position in `indices`) of the page
+        end = len(indices)
+        if after is not None:
+            if after not in self._tx_index:
+                raise ValueError(f"Unknown transaction cursor: {after}")
+            end = bisect_left(indices, self._tx_index[after])
+        end -= offset
+        start = max(0, end - limit)
         
-        return transactions[offset:offset + limit]
+        return [self.transactions[i] for i in reversed(indices[start:max(0, end)])]
     
     def get_performance_metrics(self) -> PerformanceMetrics:
-        """Calculate and return performance metrics."""
+        """Calculate and return performance metrics, cached until the next transaction."""
+        if self._metrics_cache is not None:
+            return self._metrics_cache
+        
         metrics = PerformanceMetrics()
         
         # Calculate total P&L
@@ -236,10 +268,9 @@ class MockWalletService:
             metrics.avg_position_pnl = sum(position_pnls) / len(position_pnls)
         
         # Calculate total fees
-        metrics.total_fees_paid = abs(sum(
-            t.amount for t in self.transactions if t.type == TransactionType.FEE
-        ))
+        metrics.total_fees_paid = abs(self._total_fees)
         
+        self._metrics_cache = metrics
         return metrics
     
     def get_balance_history(self, days: int = 30) -> List[Dict]:
@@ -256,7 +287,11 @@ class MockWalletService:
     def reset(self):
         """Reset wallet to initial state."""
         self.balance = self.initial_balance
+        self.all_time_high = self.initial_balance
         self.transactions = []
+        self._tx_index = {}
+        self._position_tx = {}
+        self._total_fees = 0.0
         self.position_pnl = {}
         
         # Add initial deposit transaction
@@ -276,6 +311,9 @@ class MockWalletService:
         }
 
 
+# Shared across instances so a replaced wallet never reuses a version
+_wallet_versions = itertools.count(1)
+
 # Global wallet instance
 _wallet_instance: Optional[MockWalletService] = None
 
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional
 from langchain.tools import BaseTool
 from langchain.pydantic_v1 import BaseModel, Field
 import json
@@ -14,6 +14,19 @@ class DegenScorerTool(BaseTool):
     args_schema = DegenScorerInput
     helius_client: Any = Field(default=None, exclude=True)
     
+    # Weighted average of the score components
+    SCORE_WEIGHTS: ClassVar[Dict[str, float]] = {
+        "liquidity_score": 0.20,
+        "age_score": 0.10,
+        "volume_score": 0.20,
+        "creator_score": 0.20,
+        "token_score": 0.15,
+        "apy_sustainability": 0.15
+    }
+    
+    # Stable pairs are safer
+    STABLE_TOKENS: ClassVar[FrozenSet[str]] = frozenset({"USDC", "USDT", "SOL"})
+    
     def __init__(self):
         super().__init__()
         self.helius_client = HeliusClient()
@@ -21,58 +34,52 @@ class DegenScorerTool(BaseTool):
     def _run(self, pool_address: str, pool_data: Dict = None) -> str:
         """Calculate degen score for a pool"""
         try:
-            # If no pool data provided, create basic data
-            if not pool_data:
-                pool_data = {
-                    "pool_address": pool_address,
-                    "tvl": 50000,  # Mock $50k TVL
-                    "volume_24h": 25000,
-                    "apy": 500,
-                    "age_hours": 24,
-                    "liquidity_locked": False
-                }
-            
-            # Calculate all scoring components
-            score_components = {
-                "liquidity_score": self._score_liquidity(pool_data),
-                "age_score": self._score_age(pool_data),
-                "volume_score": self._score_volume(pool_data),
-                "creator_score": self._score_creator(pool_data),
-                "token_score": self._score_tokens(pool_data),
-                "apy_sustainability": self._score_apy_sustainability(pool_data)
-            }
-            
-            # Calculate weighted average
-            weights = {
-                "liquidity_score": 0.20,
-                "age_score": 0.10,
-                "volume_score": 0.20,
-                "creator_score": 0.20,
-                "token_score": 0.15,
-                "apy_sustainability": 0.15
-            }
-            
-            total_score = sum(
-                score_components[component] * weights[component]
-                for component in score_components
-            )
-            
-            risk_level = self._get_risk_level(total_score)
-            red_flags = self._check_red_flags(pool_data, score_components)
-            
-            return json.dumps({
-                "pool_address": pool_address,
-                "degen_score": round(total_score, 1),
-                "risk_level": risk_level,
-                "score_breakdown": score_components,
-                "red_flags": red_flags,
-                "recommendation": self._get_recommendation(total_score, pool_data, red_flags),
-                "analysis_summary": self._get_analysis_summary(pool_data, score_components)
-            }, indent=2)
-            
+            return json.dumps(self.score_pool(pool_address, pool_data), indent=2)
         except Exception as e:
             return f"Error calculating degen score: {str(e)}"
     
+    def score_pool(self, pool_address: str, pool_data: Dict = None) -> Dict[str, Any]:
+        """Calculate degen score for a pool, returning the score dict (raises on failure)"""
+        # If no pool data provided, create basic data
+        if not pool_data:
+            pool_data = {
+                "pool_address": pool_address,
+                "tvl": 50000,  # Mock $50k TVL
+                "volume_24h": 25000,
+                "apy": 500,
+                "age_hours": 24,
+                "liquidity_locked": False
+            }
+        
+        # Calculate all scoring components
+        score_components = {
+            "liquidity_score": self._score_liquidity(pool_data),
+            "age_score": self._score_age(pool_data),
+            "volume_score": self._score_volume(pool_data),
+            "creator_score": self._score_creator(pool_data),
+            "token_score": self._score_tokens(pool_data),
+            "apy_sustainability": self._score_apy_sustainability(pool_data)
+        }
+        
+        # Calculate weighted average
+        total_score = sum(
+            score * self.SCORE_WEIGHTS[component]
+            for component, score in score_components.items()
+        )
+        
+        risk_level = self._get_risk_level(total_score)
+        red_flags = self._check_red_flags(pool_data, score_components)
+        
+        return {
+            "pool_address": pool_address,
+            "degen_score": round(total_score, 1),
+            "risk_level": risk_level,
+            "score_breakdown": score_components,
+            "red_flags": red_flags,
+            "recommendation": self._get_recommendation(total_score, pool_data, red_flags),
+            "analysis_summary": self._get_analysis_summary(pool_data, score_components)
+        }
+    
     def _score_liquidity(self, pool_data: Dict) -> float:
         """Score based on liquidity factors (0-10)"""
         tvl = pool_data.get("tvl", 0)
@@ -149,10 +156,7 @@ class DegenScorerTool(BaseTool):
         token_a = pool_data.get("token_a", "")
         token_b = pool_data.get("token_b", "")
         
-        # Stable pairs are safer
-        stables = ["USDC", "USDT", "SOL"]
-        
-        stable_count = sum(1 for token in [token_a, token_b] if token in stables)
+        stable_count = (token_a in self.STABLE_TOKENS) + (token_b in self.STABLE_TOKENS)
         
         if stable_count == 2:
             return 4.0  # Very safe but low yield potential
@@ -1,7 +1,7 @@
-import requests
 import json
 from typing import Dict, List, Optional, Any
 from config import Config
+from utils.http_client import http_client
 
 class HeliusClient:
     def __init__(self):
@@ -18,7 +18,7 @@ class HeliusClient:
             "params": params
         }
         
-        response = requests.post(
+        response = http_client.post(
             self.rpc_url,
             headers={"Content-Type": "application/json"},
             json=payload
@@ -81,7 +81,7 @@ class HeliusClient:
             "limit": 100
         }
         
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code != 200:
             raise Exception(f"Program search failed: {response.status_code}")
@@ -99,7 +99,7 @@ class HeliusClient:
             "mintAccounts": mint_accounts
         }
         
-        response = requests.post(url, params=params, json=payload)
+        response = http_client.post(url, params=params, json=payload)
         
         if response.status_code != 200:
             raise Exception(f"Metadata request failed: {response.status_code}")
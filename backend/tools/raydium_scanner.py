@@ -8,7 +8,7 @@ import sys
 import os
 import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.cache import api_cache
+from utils.cache import api_cache, cache_raydium_pools, RAYDIUM_POOLS_KEY
 from utils.http_client import http_client
 from tools.pool_validator import PoolValidator
 from tools.enhanced_pool_validator import enhanced_validator
@@ -24,13 +24,16 @@ class RadiumScannerTool(BaseTool):
     
     def _run(self, min_apy: float = 100, min_tvl: float = 10000) -> str:
         """Scan Raydium for real pools with actual Solana addresses"""
+        return json.dumps(self.scan_pools(min_apy, min_tvl), indent=2)
+    
+    def scan_pools(self, min_apy: float = 100, min_tvl: float = 10000) -> Dict:
+        """Scan Raydium, returning the result dict (fallback data on failure)"""
         try:
             print(f"[RadiumScanner] Scanning for pools with APY >= {min_apy}%")
             validator = PoolValidator()
             
             # Check cache first
-            cache_key = "raydium_pools"
-            cached_data = api_cache.get(cache_key)
+            cached_data = api_cache.get(RAYDIUM_POOLS_KEY)
             
             if cached_data:
                 print(f"[RadiumScanner] Using cached data")
@@ -54,8 +57,8 @@ class RadiumScannerTool(BaseTool):
                     return self._get_fallback_data(min_apy)
                 
                 data = response.json()
-                # Cache for 30 seconds
-                api_cache.set(cache_key, data, ttl_seconds=30)
+                # Cache for 30 seconds, with the ammId index /analyze looks pools up in
+                cache_raydium_pools(data, ttl_seconds=30)
                 print(f"[RadiumScanner] Fetched fresh data and cached")
             pools = []
             
@@ -141,7 +144,7 @@ class RadiumScannerTool(BaseTool):
             # Sort by APY
             validated_pools.sort(key=lambda x: x.get("apy", 0), reverse=True)
             
-            return json.dumps({
+            return {
                 "source": "RAYDIUM_REAL",
                 "found_pools": len(validated_pools),
                 "pools": validated_pools[:20],  # Top 20
@@ -150,7 +153,7 @@ class RadiumScannerTool(BaseTool):
                 "min_tvl_filter": min_tvl,
                 "validation_applied": True,
                 "filtered_count": len(pools) - len(validated_pools)
-            }, indent=2)
+            }
             
         except Exception as e:
             print(f"[RadiumScanner] Error: {str(e)}")
@@ -182,9 +185,9 @@ class RadiumScannerTool(BaseTool):
         # Return shortened mint as fallback
         return mint[:4] + "..." + mint[-4:] if len(mint) > 8 else mint
     
-    def _get_fallback_data(self, min_apy: float) -> str:
+    def _get_fallback_data(self, min_apy: float) -> Dict:
         """Return fallback data when API fails"""
-        return json.dumps({
+        return {
             "source": "RAYDIUM_FALLBACK",
             "found_pools": 1,
             "pools": [{
@@ -201,7 +204,7 @@ class RadiumScannerTool(BaseTool):
                 "solscan_url": "https://solscan.io/account/7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
             }],
             "error": "Using fallback data - API unavailable"
-        }, indent=2)
+        }
     
     async def _arun(self, min_apy: float = 100, min_tvl: float = 10000) -> str:
         """Async version"""
@@ -1,10 +1,10 @@
-import requests
 import json
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from langchain.tools import BaseTool
 from langchain.pydantic_v1 import BaseModel, Field
 from tools.helius_client import HeliusClient
+from utils.http_client import http_client
 
 class RealPoolScannerTool(BaseTool):
     name = "real_pool_scanner"
@@ -66,7 +66,7 @@ class RealPoolScannerTool(BaseTool):
                     min_apy = float(min_apy) if min_apy else 100
             
             print(f"[RealPoolScanner] Fetching pools from DeFiLlama API with min APY: {min_apy}%")
-            response = requests.get("https://yields.llama.fi/pools", timeout=10)
+            response = http_client.get("https://yields.llama.fi/pools", timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -188,7 +188,7 @@ class RealPoolScannerTool(BaseTool):
             
             # Jupiter Price API v6
             url = f"https://price.jup.ag/v6/price?ids={','.join(mints)}"
-            response = requests.get(url, timeout=5)
+            response = http_client.get(url, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
@@ -239,7 +239,7 @@ class RealPoolScannerTool(BaseTool):
             ids_str = ",".join(coingecko_ids)
             url = f"https://api.coingecko.com/api/v3/simple/price?ids={ids_str}&vs_currencies=usd&include_market_cap=true&include_24hr_vol=true&include_24hr_change=true"
             
-            response = requests.get(url, timeout=5)
+            response = http_client.get(url, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
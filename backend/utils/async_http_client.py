@@ -0,0 +1,25 @@
+"""Shared async HTTP client for calls made directly from request handlers"""
+from typing import Optional
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=5.0,
+            headers={
+                "User-Agent": "Solana-Degen-Hunter/1.0",
+                "Accept": "application/json"
+            }
+        )
+    return _client
+
+async def close_async_http_client():
+    """Close the shared AsyncClient"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import json
 
 class SimpleCache:
@@ -35,4 +35,15 @@ class SimpleCache:
             del self.cache[key]
 
 # Global cache instance
-api_cache = SimpleCache()
\ No newline at end of file
+api_cache = SimpleCache()
+
+RAYDIUM_POOLS_KEY = "raydium_pools"
+RAYDIUM_POOLS_BY_ID_KEY = "raydium_pools_by_id"
+
+def cache_raydium_pools(pools: List[Dict[str, Any]], ttl_seconds: int = 30) -> Dict[str, Dict[str, Any]]:
+    """Cache the Raydium pairs list together with an ammId index, returning the index"""
+    # Built back to front so the first pool wins on duplicate ammIds, as a linear scan would
+    pools_by_id = {pool.get("ammId"): pool for pool in reversed(pools)}
+    api_cache.set(RAYDIUM_POOLS_KEY, pools, ttl_seconds=ttl_seconds)
+    api_cache.set(RAYDIUM_POOLS_BY_ID_KEY, pools_by_id, ttl_seconds=ttl_seconds)
+    return pools_by_id
\ No newline at end of file
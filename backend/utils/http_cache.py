@@ -0,0 +1,42 @@
+"""HTTP caching helpers (ETag + Cache-Control) for polled GET endpoints"""
+import hashlib
+import secrets
+from typing import Any, Callable
+
+import orjson
+from fastapi import Request, Response
+
+# Distinguishes version-based ETags issued before a restart, when counters start over
+_BOOT_ID = secrets.token_hex(4)
+
+def compute_etag(body: bytes) -> str:
+    """Short content hash of a serialized response body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def cached_json_response(request: Request, payload: Any, max_age: int = 5) -> Response:
+    """Serialize payload with ETag/Cache-Control headers, answering 304 when the client copy is current"""
+    body = orjson.dumps(payload, default=str)
+    etag = compute_etag(body)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"max-age={max_age}"
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def versioned_json_response(request: Request, version: int, build: Callable[[], Any], max_age: int = 5) -> Response:
+    """Weak ETag from a mutation counter; build() only runs (and serializes) when the client copy is stale"""
+    etag = f'W/"{_BOOT_ID}-{version}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"max-age={max_age}"
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    body = orjson.dumps(build(), default=str)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Dict, List, Optional
 from functools import wraps
+import asyncio
 import time
 import json
 
@@ -13,39 +14,59 @@ class PerformanceMonitor:
         self.slow_query_threshold = 5.0  # seconds
         
     def track_execution(self, operation: str):
-        """Decorator to track execution time"""
+        """Decorator to track execution time (supports sync and async functions)"""
         def decorator(func):
+            # Keep coroutine functions async so FastAPI awaits them on the event loop
+            # and the timing covers the awaited work, not just coroutine creation
+            if asyncio.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    start_time = time.time()
+                    error = None
+                    
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        error = str(e)
+                        raise
+                    finally:
+                        self._finish_execution(operation, start_time, error)
+                        
+                return async_wrapper
+            
             @wraps(func)
             def wrapper(*args, **kwargs):
                 start_time = time.time()
-                result = None
                 error = None
                 
                 try:
-                    result = func(*args, **kwargs)
-                    return result
+                    return func(*args, **kwargs)
                 except Exception as e:
                     error = str(e)
                     raise
                 finally:
-                    execution_time = time.time() - start_time
-                    
-                    # Record metric
-                    self._record_metric(
-                        operation=operation,
-                        execution_time=execution_time,
-                        success=error is None,
-                        error=error,
-                        timestamp=datetime.now().isoformat()
-                    )
-                    
-                    # Log slow operations
-                    if execution_time > self.slow_query_threshold:
-                        print(f"[SLOW QUERY] {operation} took {execution_time:.2f}s")
+                    self._finish_execution(operation, start_time, error)
                         
             return wrapper
         return decorator
     
+    def _finish_execution(self, operation: str, start_time: float, error: Optional[str]):
+        """Record a finished execution and log it if slow"""
+        execution_time = time.time() - start_time
+        
+        # Record metric
+        self._record_metric(
+            operation=operation,
+            execution_time=execution_time,
+            success=error is None,
+            error=error,
+            timestamp=datetime.now().isoformat()
+        )
+        
+        # Log slow operations
+        if execution_time > self.slow_query_threshold:
+            print(f"[SLOW QUERY] {operation} took {execution_time:.2f}s")
+    
     def _record_metric(self, operation: str, execution_time: float, 
                       success: bool, error: Optional[str], timestamp: str):
         """Record a performance metric"""
@@ -0,0 +1,59 @@
+"""Task progress storage shared across workers"""
+import time
+import orjson
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+from utils.redis_client import get_redis
+
+class ProgressStore:
+    """Stores task progress as a Redis hash with TTL, or in-memory when Redis isn't configured"""
+    
+    def __init__(self, ttl_seconds: int = 3600, max_local_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        # Bounded fallback: evicts expired and least-recently-used tasks even if nobody reads them again
+        self._local = TTLCache(maxsize=max_local_entries, ttl=ttl_seconds)
+    
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return f"progress:{task_id}"
+    
+    async def set(self, task_id: str, state: Dict[str, Any]):
+        """Replace the progress state of a task, stamping it with updated_at (epoch seconds)"""
+        state = {**state, "updated_at": time.time()}
+        client = get_redis()
+        if client is None:
+            self._local[task_id] = state
+            return
+        
+        key = self._key(task_id)
+        # Hash values are strings - JSON-encode so nested results round-trip
+        mapping = {field: orjson.dumps(value, default=str) for field, value in state.items()}
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            # Visible to this worker only until Redis is back
+            print(f"[ProgressStore] Redis unavailable, storing {task_id} locally: {e}")
+            self._local[task_id] = state
+    
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get the progress state of a task, or None if unknown/expired"""
+        client = get_redis()
+        if client is None:
+            return self._local.get(task_id)
+        
+        try:
+            raw = await client.hgetall(self._key(task_id))
+        except RedisError as e:
+            print(f"[ProgressStore] Redis unavailable, reading {task_id} locally: {e}")
+            return self._local.get(task_id)
+        if not raw:
+            return None
+        return {field: orjson.loads(value) for field, value in raw.items()}
+
+# Global progress store
+progress_store = ProgressStore()
@@ -0,0 +1,20 @@
+"""Shared async Redis client - enabled when REDIS_URL is configured"""
+from typing import Optional
+import redis.asyncio as redis
+from config import Config
+
+_client: Optional[redis.Redis] = None
+
+def get_redis() -> Optional[redis.Redis]:
+    """Get the shared Redis client, or None when Redis isn't configured"""
+    global _client
+    if _client is None and Config.REDIS_URL:
+        _client = redis.from_url(Config.REDIS_URL, decode_responses=True)
+    return _client
+
+async def close_redis():
+    """Close the shared Redis client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,41 @@
+"""Request coalescing - concurrent identical requests share one computation"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+class RequestCoalescer:
+    """Registry of in-flight computations keyed by request identity"""
+    
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Run compute() for key, or await the result of an identical call already in flight"""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Shield so a disconnecting follower can't cancel the shared result
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved - there may be no followers
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+    
+    @property
+    def inflight(self) -> int:
+        """Number of distinct computations currently running"""
+        return len(self._inflight)
+
+# Global instance
+request_coalescer = RequestCoalescer()
@@ -1,10 +1,13 @@
 """WebSocket connection manager for real-time updates"""
 from typing import Dict, Set, List
 from fastapi import WebSocket
-import json
+import orjson
 import asyncio
 from datetime import datetime
 
+# Clients sent to concurrently before yielding back to the event loop
+BROADCAST_BATCH_SIZE = 50
+
 class ConnectionManager:
     """Manages WebSocket connections and broadcasts"""
     
@@ -38,7 +41,7 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send message to specific connection"""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(orjson.dumps(message, default=str).decode())
         except Exception as e:
             print(f"[WS] Error sending message: {e}")
             self.disconnect(websocket)
@@ -49,17 +52,29 @@ class ConnectionManager:
         message["channel"] = channel
         message["timestamp"] = datetime.now().isoformat()
         
-        # Send to all active connections
+        # Snapshot subscribed clients - connections may come and go while we await
+        recipients = [
+            connection for connection in self.active_connections
+            if channel == "general" or channel in self.connection_info.get(connection, {}).get("subscriptions", set())
+        ]
+        
+        # Serialize once for every recipient; sent as a text frame like send_json would
+        payload = orjson.dumps(message, default=str).decode()
+        
+        # Send in concurrent batches, yielding between them so large audiences don't starve other requests
         disconnected = []
-        for connection in self.active_connections:
-            try:
-                # Check if client is subscribed to this channel
-                subs = self.connection_info.get(connection, {}).get("subscriptions", set())
-                if channel == "general" or channel in subs:
-                    await connection.send_json(message)
-            except Exception as e:
-                print(f"[WS] Broadcast error: {e}")
-                disconnected.append(connection)
+        for start in range(0, len(recipients), BROADCAST_BATCH_SIZE):
+            batch = recipients[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in batch),
+                return_exceptions=True
+            )
+            for connection, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    print(f"[WS] Broadcast error: {result}")
+                    disconnected.append(connection)
+            if start + BROADCAST_BATCH_SIZE < len(recipients):
+                await asyncio.sleep(0)
                 
         # Clean up disconnected clients
         for conn in disconnected: